@@ -1,3 +1,13 @@
+import mmap
+import struct
+from array import array
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, search_many works without it
+    np = None
+
 """
     Perform binary search iteratively to find the target element in a sorted array.
     
@@ -70,6 +80,430 @@ def binary_search_recursive(arr: list, target: int, left: int = None, right: int
     else:
         return binary_search_recursive(arr, target, left, mid - 1)
 
+"""
+    Look up many targets in the same sorted array in one pass.
+    
+    The targets are visited in sorted order, so the search position in arr
+    only ever moves forward. When there are many targets compared to the
+    array size, both are swept together like the merge step of merge sort;
+    otherwise each target is binary searched starting from where the
+    previous one was found. A numpy.ndarray is searched with a single
+    vectorized np.searchsorted call instead.
+    
+    Args:
+        arr (list): The sorted input array to search through
+        targets (list): The elements to search for, in any order
+    
+    Returns:
+        list: For each target, the index of its first occurrence in arr,
+              or -1 if it is not there (a numpy.ndarray for ndarray input)
+        
+    Time Complexity: O(m log m + min(n + m, m log n)) for m targets
+    Space Complexity: O(m) for the sorted order and the results
+"""
+def search_many(arr: list, targets: list) -> list:
+    if np is not None and isinstance(arr, np.ndarray):
+        targets = np.asarray(targets)
+        idx = np.searchsorted(arr, targets)
+        if len(arr) == 0:
+            return np.full(len(targets), -1)
+        found = (idx < len(arr)) & (arr[np.minimum(idx, len(arr) - 1)] == targets)
+        return np.where(found, idx, -1)
+    
+    n, m = len(arr), len(targets)
+    results = [-1] * m
+    order = sorted(range(m), key=targets.__getitem__)
+    pos = 0
+    
+    if n <= 4 * m:
+        # Merge-like sweep: walk both sorted sequences together
+        for q in order:
+            target = targets[q]
+            while pos < n and arr[pos] < target:
+                pos += 1
+            if pos < n and arr[pos] == target:
+                results[q] = pos
+    else:
+        # Few targets: binary search each one, never looking behind pos
+        for q in order:
+            target = targets[q]
+            pos = bisect_left(arr, target, pos)
+            if pos < n and arr[pos] == target:
+                results[q] = pos
+    
+    return results
+
+"""
+    Find the first position where target could be inserted keeping arr sorted.
+    
+    Args:
+        arr (list): The sorted input array to search through
+        target (int): The element to search for
+    
+    Returns:
+        int: Index of the first element >= target (len(arr) if there is none)
+        
+    Time Complexity: O(log n)
+    Space Complexity: O(1)
+"""
+def lower_bound(arr: list, target: int) -> int:
+    left, right = 0, len(arr)
+    
+    # Invariant: arr[:left] < target <= arr[right:]
+    while left < right:
+        mid = (left + right) // 2
+        if arr[mid] < target:
+            left = mid + 1
+        else:
+            right = mid
+    
+    return left
+
+
+
+"""
+    Find the last position where target could be inserted keeping arr sorted.
+    
+    Args:
+        arr (list): The sorted input array to search through
+        target (int): The element to search for
+    
+    Returns:
+        int: Index of the first element > target (len(arr) if there is none)
+        
+    Time Complexity: O(log n)
+    Space Complexity: O(1)
+"""
+def upper_bound(arr: list, target: int) -> int:
+    left, right = 0, len(arr)
+    
+    # Invariant: arr[:left] <= target < arr[right:]
+    while left < right:
+        mid = (left + right) // 2
+        if target < arr[mid]:
+            right = mid
+        else:
+            left = mid + 1
+    
+    return left
+
+
+
+"""
+    Find the block of elements equal to target.
+    
+    Args:
+        arr (list): The sorted input array to search through
+        target (int): The element to search for
+    
+    Returns:
+        tuple: (first, end) such that arr[first:end] are all the elements
+               equal to target; first == end if there are none
+        
+    Time Complexity: O(log n)
+    Space Complexity: O(1)
+"""
+def equal_range(arr: list, target: int) -> tuple:
+    return lower_bound(arr, target), upper_bound(arr, target)
+
+
+
+"""
+    Count the elements of a sorted array between low and high (inclusive).
+    
+    Args:
+        arr (list): The sorted input array to search through
+        low (int): Smallest value to count
+        high (int): Largest value to count
+    
+    Returns:
+        int: Number of elements x with low <= x <= high
+        
+    Time Complexity: O(log n)
+    Space Complexity: O(1)
+"""
+def count_in_range(arr: list, low: int, high: int) -> int:
+    if high < low:
+        return 0
+    return upper_bound(arr, high) - lower_bound(arr, low)
+
+
+
+"""
+    Perform exponential (galloping) search for target in a sorted sequence.
+    
+    Probes indices 1, 2, 4, 8, ... until it passes target, then binary
+    searches the last gap. arr does not need a length: reading past its end
+    only has to raise IndexError, so this also works on lazily loaded or
+    unbounded sequences, and it is fast when target is near the start.
+    
+    Args:
+        arr (list): The sorted sequence to search through
+        target (int): The element to search for
+    
+    Returns:
+        int: Index of the first occurrence of target if found, -1 otherwise
+        
+    Time Complexity: O(log i) where i is the position of target
+    Space Complexity: O(1)
+"""
+def exponential_search(arr: list, target: int) -> int:
+    def smaller_than_target(i):
+        # Positions past the end behave like +infinity
+        try:
+            return arr[i] < target
+        except IndexError:
+            return False
+    
+    # Gallop until arr[bound] >= target (or we run off the end)
+    bound = 1
+    while smaller_than_target(bound - 1):
+        bound *= 2
+    
+    # The first element >= target is in (bound // 2 - 1, bound - 1]
+    left, right = bound // 2, bound - 1
+    while left < right:
+        mid = (left + right) // 2
+        if smaller_than_target(mid):
+            left = mid + 1
+        else:
+            right = mid
+    
+    try:
+        return left if arr[left] == target else -1
+    except IndexError:
+        return -1
+
+
+
+"""
+    Perform interpolation search for target in a sorted numeric array.
+    
+    Instead of always probing the middle, guesses where target should be
+    from its value relative to the two ends, the way you open a dictionary
+    near the right letter. On uniformly distributed keys (such as
+    timestamps) that takes far fewer probes than binary search.
+    
+    Args:
+        arr (list): The sorted array of numbers to search through
+        target (int): The number to search for
+    
+    Returns:
+        int: Index of the target element if found, -1 otherwise
+        
+    Time Complexity: O(log log n) on uniform data, O(n) worst case
+    Space Complexity: O(1)
+"""
+def interpolation_search(arr: list, target: int) -> int:
+    left, right = 0, len(arr) - 1
+    
+    while left <= right and arr[left] <= target <= arr[right]:
+        if arr[left] == arr[right]:
+            return left if arr[left] == target else -1
+        
+        # Estimate the position from the value
+        pos = left + int((target - arr[left]) * (right - left) / (arr[right] - arr[left]))
+        
+        if arr[pos] == target:
+            return pos
+        elif arr[pos] < target:
+            left = pos + 1
+        else:
+            right = pos - 1
+    
+    return -1
+
+class EytzingerIndex:
+    """
+    Read-only sorted index stored in Eytzinger (BFS) order.
+    
+    A plain binary search over a big sorted list jumps all over memory: the
+    first probes are n/2, n/4, 3n/4, ... apart. The Eytzinger layout stores
+    the same values as an implicit binary tree in breadth-first order (root
+    at 1, children of k at 2k and 2k+1), so the first levels of every search
+    sit together at the front of the buffer and stay cached, and each step
+    goes to a neighbouring slot of the previous level. Values go into a
+    compact array.array when they are all ints or all floats.
+    
+    Build once with EytzingerIndex(sorted_arr), then call search() or
+    lower_bound() as often as needed.
+    """
+    
+    def __init__(self, arr: list):
+        """
+        Build the layout from a sorted array.
+        
+        Time Complexity: O(n)
+        Space Complexity: O(n) for the layout and the rank table
+        """
+        self.n = len(arr)
+        if arr and all(type(x) is int for x in arr) and -2 ** 63 <= arr[0] and arr[-1] < 2 ** 63:
+            self.layout = array('q', bytes(8 * (self.n + 1)))
+        elif arr and all(type(x) is float for x in arr):
+            self.layout = array('d', bytes(8 * (self.n + 1)))
+        else:
+            self.layout = [None] * (self.n + 1)
+        # ranks[k] is the index in the sorted array of the value at slot k
+        self.ranks = array('q', bytes(8 * (self.n + 1)))
+        
+        # An in-order walk of the implicit tree visits the slots in sorted
+        # order, so it hands out the sorted values one by one
+        i, k, stack = 0, 1, []
+        while stack or k <= self.n:
+            if k <= self.n:
+                stack.append(k)
+                k = 2 * k
+            else:
+                k = stack.pop()
+                self.layout[k] = arr[i]
+                self.ranks[k] = i
+                i += 1
+                k = 2 * k + 1
+    
+    def lower_bound(self, target) -> int:
+        """
+        Index in the original sorted array of the first element >= target.
+        
+        Time Complexity: O(log n)
+        Space Complexity: O(1)
+        """
+        layout, n, k = self.layout, self.n, 1
+        # Go right (bit 1) while the slot is smaller than target, else left
+        while k <= n:
+            k = 2 * k + (layout[k] < target)
+        # The answer is the last slot where we went left: drop the trailing
+        # right moves and that one left move
+        k >>= (~k & (k + 1)).bit_length()
+        return self.ranks[k] if k else n
+    
+    def search(self, target) -> int:
+        """
+        Index in the original sorted array of target, or -1 if absent.
+        
+        Time Complexity: O(log n)
+        Space Complexity: O(1)
+        """
+        layout, n, k = self.layout, self.n, 1
+        while k <= n:
+            k = 2 * k + (layout[k] < target)
+        k >>= (~k & (k + 1)).bit_length()
+        if k and layout[k] == target:
+            return self.ranks[k]
+        return -1
+
+class MappedRecords:
+    """
+    Sorted (or unsorted) file of fixed-width records viewed as a sequence.
+    
+    The file is memory-mapped and read through a memoryview, so opening it
+    is instant and only the pages a search actually touches are read from
+    disk; nothing is parsed into a list. Records are either
+    - numbers in a struct format such as 'q' (int64), 'i' or 'd', in native
+      byte order, as written by array.array.tofile, or
+    - raw keys of record_size bytes (pass fmt=None), compared as bytes;
+      big-endian unsigned numbers sort correctly this way.
+    
+    Since it supports len() and indexing, every search function in this
+    module works on it directly. Slicing returns a plain list of records,
+    so no view into the mapping outlives close():
+    
+        with MappedRecords("ids.bin", "q") as records:
+            index = binary_search_iterative(records, 42)
+    """
+    
+    def __init__(self, path: str, fmt: str = 'q', record_size: int = None):
+        self.fmt = fmt
+        self._map = self._bytes = self._items = None
+        self._file = open(path, "rb")
+        try:
+            if fmt is not None:
+                record_size = struct.calcsize(fmt)
+            elif not record_size:
+                raise ValueError("record_size is required when fmt is None")
+            self.record_size = record_size
+            size = self._file.seek(0, 2)
+            if size % record_size:
+                raise ValueError(f"file size {size} is not a multiple of the record size {record_size}")
+            self.n = size // record_size
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+            self._bytes = memoryview(self._map if self._map is not None else b"")
+            if fmt is not None:
+                self._items = self._bytes.cast(fmt)
+        except Exception:
+            self.close()
+            raise
+    
+    def __len__(self):
+        return self.n
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(self.n))]
+        if self._items is not None:
+            return self._items[i]
+        if i < 0:
+            i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("record index out of range")
+        start = i * self.record_size
+        return self._bytes[start:start + self.record_size].tobytes()
+    
+    def find(self, needle: bytes) -> int:
+        """
+        Index of the first record whose bytes equal needle, or -1.
+        
+        Scans the mapping with mmap.find (in C), skipping matches that do
+        not start on a record boundary.
+        
+        Raises:
+            ValueError: If needle is not exactly record_size bytes long
+        """
+        if len(needle) != self.record_size:
+            raise ValueError("needle does not match the record size")
+        if self._map is None:
+            return -1
+        pos = self._map.find(needle)
+        while pos != -1 and pos % self.record_size:
+            pos = self._map.find(needle, pos + 1)
+        return -1 if pos == -1 else pos // self.record_size
+    
+    def close(self):
+        """Release the views and unmap the file."""
+        if self._items is not None:
+            self._items.release()
+        if self._bytes is not None:
+            self._bytes.release()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+
+"""
+    Perform binary search directly on a sorted file of fixed-width records.
+    
+    Args:
+        path (str): File of sorted fixed-width records
+        target (int): The record to search for (bytes when fmt is None)
+        fmt (str): struct format of one record, e.g. 'q' for int64
+        record_size (int): Record width in bytes when fmt is None
+    
+    Returns:
+        int: Index of the target record if found, -1 otherwise
+        
+    Time Complexity: O(log n) record reads
+    Space Complexity: O(1), the file is mapped rather than loaded
+"""
+def binary_search_file(path: str, target, fmt: str = 'q', record_size: int = None) -> int:
+    with MappedRecords(path, fmt, record_size) as records:
+        return binary_search_iterative(records, target)
+
 def run_test_case(search_func, arr: list, target: int, test_name: str):
     """Helper function to run and display test case results."""
     result = search_func(arr, target)
@@ -88,11 +522,17 @@ def main():
         print("1. Iterative Binary Search")
         print("2. Recursive Binary Search")
         print("3. Run All Test Cases")
-        print("4. Exit")
+        print("4. Batched Search (search_many)")
+        print("5. Lower Bound / Upper Bound / Equal Range")
+        print("6. Count In Range")
+        print("7. Exponential Search")
+        print("8. Interpolation Search")
+        print("9. Eytzinger Layout Search")
+        print("10. Exit")
         
-        choice = input("\nEnter your choice (1-4): ").strip()
+        choice = input("\nEnter your choice (1-10): ").strip()
         
-        if choice == '4':
+        if choice == '10':
             print("\nThank you for using Binary Search Demo!")
             break
             
@@ -129,8 +569,37 @@ def main():
                                 f"Iterative Binary Search: {test_name}")
                     run_test_case(binary_search_recursive, arr, target,
                                 f"Recursive Binary Search: {test_name}")
+        elif choice == '4':
+            arr = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+            targets = [6, 1, 10, 9, 0, 4]
+            print(f"\nArray: {arr}")
+            print(f"Targets: {targets}")
+            print(f"Results: {search_many(arr, targets)}")
+        elif choice == '5':
+            arr = [1, 2, 2, 2, 3, 5, 8]
+            print(f"\nArray: {arr}")
+            for target in [2, 4, 0, 9]:
+                print(f"Target {target}: lower_bound={lower_bound(arr, target)}, "
+                      f"upper_bound={upper_bound(arr, target)}, "
+                      f"equal_range={equal_range(arr, target)}")
+        elif choice == '6':
+            arr = [1, 2, 2, 2, 3, 5, 8]
+            print(f"\nArray: {arr}")
+            for low, high in [(2, 3), (4, 8), (9, 12), (0, 100)]:
+                print(f"Elements in [{low}, {high}]: {count_in_range(arr, low, high)}")
+        elif choice == '9':
+            for arr, target, test_name in test_cases:
+                index = EytzingerIndex(arr)
+                print(f"\nLayout: {list(index.layout[1:])}")
+                run_test_case(lambda _, t: index.search(t), arr, target,
+                              f"Eytzinger Layout Search: {test_name}")
+        elif choice in ['7', '8']:
+            search_func = exponential_search if choice == '7' else interpolation_search
+            name = "Exponential Search" if choice == '7' else "Interpolation Search"
+            for arr, target, test_name in test_cases:
+                run_test_case(search_func, arr, target, f"{name}: {test_name}")
         else:
-            print("\nInvalid choice! Please enter a number between 1 and 4.")
+            print("\nInvalid choice! Please enter a number between 1 and 10.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,12 +1,22 @@
+import itertools
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+
 class Node:
     """Node class for Binary Search Tree"""
+    __slots__ = ('value', 'left', 'right', 'size')
+    
     def __init__(self, value):
         self.value = value
         self.left = None
         self.right = None
+        self.size = 1  # number of nodes in the subtree rooted here
 
 class BinarySearchTree:
     """Binary Search Tree implementation with various operations"""
+    _node_class = Node
+    
     def __init__(self):
         self.root = None
     
@@ -15,7 +25,7 @@ class BinarySearchTree:
         Time Complexity: O(h) where h is height of tree
         Space Complexity: O(1)
         """
-        new_node = Node(value)
+        new_node = self._node_class(value)
         
         if not self.root:
             self.root = new_node
@@ -23,6 +33,7 @@ class BinarySearchTree:
         
         current = self.root
         while True:
+            current.size += 1  # new_node ends up below current
             if value < current.value:
                 if current.left is None:
                     current.left = new_node
@@ -43,14 +54,14 @@ class BinarySearchTree:
     
     def _insert_recursive(self, node, value):
         if not node:
-            return Node(value)
+            return self._node_class(value)
         
         if value < node.value:
             node.left = self._insert_recursive(node.left, value)
         else:
             node.right = self._insert_recursive(node.right, value)
         
-        return node
+        return self._rebalance(node)
     
     def search_iterative(self, value):
         """Search for a value in BST using iterative approach
@@ -112,10 +123,10 @@ class BinarySearchTree:
             # Case 3: Node with two children
             else:
                 min_node = self._find_min(node.right)
-                node.value = min_node.value
+                self._copy_entry(min_node, node)
                 node.right = self._delete_recursive(node.right, min_node.value)
         
-        return node
+        return self._rebalance(node)
     
     def _find_min(self, node):
         """Helper function to find minimum value node"""
@@ -124,42 +135,1005 @@ class BinarySearchTree:
             current = current.left
         return current
     
+    def _copy_entry(self, source, target):
+        """Move the data of source into target when deleting target's old value"""
+        target.value = source.value
+    
+    def _rebalance(self, node):
+        """Hook called on each node on the way back up from an insert or delete.
+        Returns the node that takes its place; a plain BST never rebalances.
+        """
+        self._update(node)
+        return node
+    
+    @staticmethod
+    def _size(node):
+        return node.size if node else 0
+    
+    def _update(self, node):
+        """Recompute the cached fields of a node from its children"""
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+    
+    def __len__(self):
+        return self._size(self.root)
+    
+    # Order Statistics: answered from the subtree sizes in O(h)
+    def select(self, k):
+        """Return the k-th smallest value (0-based, negative k counts from the end)
+        Time Complexity: O(h)
+        """
+        n = len(self)
+        if k < 0:
+            k += n
+        if not 0 <= k < n:
+            raise IndexError("select index out of range")
+        current = self.root
+        while True:
+            left = self._size(current.left)
+            if k < left:
+                current = current.left
+            elif k == left:
+                return current.value
+            else:
+                k -= left + 1
+                current = current.right
+    
+    def rank(self, value):
+        """Number of values strictly smaller than value
+        Time Complexity: O(h)
+        """
+        return self._rank(value, inclusive=False)
+    
+    def _rank(self, value, inclusive):
+        count = 0
+        current = self.root
+        while current:
+            if current.value < value or (inclusive and current.value == value):
+                count += self._size(current.left) + 1
+                current = current.right
+            else:
+                current = current.left
+        return count
+    
+    def count_range(self, lo, hi):
+        """Number of values v with lo <= v <= hi
+        Time Complexity: O(h)
+        """
+        if hi < lo:
+            return 0
+        return self._rank(hi, inclusive=True) - self._rank(lo, inclusive=False)
+    
+    def floor(self, value):
+        """Largest value <= value, or None"""
+        return self._bound(value, below=True, inclusive=True)
+    
+    def ceiling(self, value):
+        """Smallest value >= value, or None"""
+        return self._bound(value, below=False, inclusive=True)
+    
+    def predecessor(self, value):
+        """Largest value < value, or None"""
+        return self._bound(value, below=True, inclusive=False)
+    
+    def successor(self, value):
+        """Smallest value > value, or None"""
+        return self._bound(value, below=False, inclusive=False)
+    
+    def _bound(self, value, below, inclusive):
+        """Closest value on one side of value in a single O(h) descent"""
+        best = None
+        current = self.root
+        while current:
+            if inclusive and current.value == value:
+                return current.value
+            if (current.value < value) == below and current.value != value:
+                best = current.value  # on the wanted side, look for a closer one
+                current = current.right if below else current.left
+            else:
+                current = current.left if below else current.right
+        return best
+    
+    def height(self):
+        """Number of levels in the tree (0 when empty)
+        Time Complexity: O(n)
+        Space Complexity: O(w) where w is the widest level
+        """
+        levels = 0
+        level = [self.root] if self.root else []
+        while level:
+            levels += 1
+            level = [child for node in level for child in (node.left, node.right) if child]
+        return levels
+    
     # Tree Traversal Methods
     def inorder(self):
         """Inorder traversal: Left -> Root -> Right"""
-        result = []
-        self._inorder_recursive(self.root, result)
-        return result
-    
-    def _inorder_recursive(self, node, result):
-        if node:
-            self._inorder_recursive(node.left, result)
-            result.append(node.value)
-            self._inorder_recursive(node.right, result)
+        return list(self.iter_inorder())
     
     def preorder(self):
         """Preorder traversal: Root -> Left -> Right"""
-        result = []
-        self._preorder_recursive(self.root, result)
-        return result
+        return list(self.iter_preorder())
+    
+    def postorder(self):
+        """Postorder traversal: Left -> Right -> Root"""
+        return list(self.iter_postorder())
+    
+    # Lazy traversals: iterative generators holding only the current path,
+    # so they work on trees of any depth and stop as soon as the caller does
+    def __iter__(self):
+        return self.iter_inorder()
+    
+    def __reversed__(self):
+        return self.iter_inorder(reverse=True)
+    
+    def iter_inorder(self, reverse=False):
+        """Yield values in sorted order (descending with reverse=True)
+        Time Complexity: O(n) for the whole traversal, O(1) amortized per value
+        Space Complexity: O(h)
+        """
+        near, far = ('right', 'left') if reverse else ('left', 'right')
+        stack = []
+        current = self.root
+        while stack or current:
+            while current:
+                stack.append(current)
+                current = getattr(current, near)
+            current = stack.pop()
+            yield current.value
+            current = getattr(current, far)
+    
+    def iter_preorder(self):
+        """Yield values Root -> Left -> Right
+        Space Complexity: O(h)
+        """
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            yield node.value
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+    
+    def iter_postorder(self):
+        """Yield values Left -> Right -> Root
+        Space Complexity: O(h)
+        """
+        stack = []
+        current, last = self.root, None
+        while stack or current:
+            while current:
+                stack.append(current)
+                current = current.left
+            node = stack[-1]
+            if node.right and node.right is not last:
+                current = node.right
+            else:
+                stack.pop()
+                yield node.value
+                last = node
+    
+    def items_between(self, lo, hi):
+        """Yield the values v with lo <= v <= hi in sorted order
+        Only the nodes on the paths to lo and hi and those in range are visited.
+        Time Complexity: O(h + k) for k values in range
+        Space Complexity: O(h)
+        """
+        stack = []
+        current = self.root
+        while stack or current:
+            while current:
+                if current.value < lo:
+                    current = current.right  # the whole left subtree is below lo
+                else:
+                    stack.append(current)
+                    current = current.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.value > hi:
+                return
+            yield node.value
+            current = node.right
+    # Bulk Operations
+    @classmethod
+    def from_sorted(cls, iterable):
+        """Build a perfectly balanced tree from values in ascending order
+        Time Complexity: O(n)
+        Space Complexity: O(n) for the values, O(log n) recursion depth
+        """
+        values = list(iterable)
+        for i in range(1, len(values)):
+            if values[i] < values[i - 1]:
+                raise ValueError("from_sorted() needs values in ascending order")
+        tree = cls()
+        tree.root = tree._build(values, 0, len(values))
+        return tree
+    
+    @classmethod
+    def from_unsorted(cls, iterable):
+        """Sort the values, then bulk-build a balanced tree
+        Time Complexity: O(n log n)
+        """
+        return cls.from_sorted(sorted(iterable))
+    
+    def _build(self, values, lo, hi):
+        """Balanced subtree holding values[lo:hi]"""
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = self._node_class(values[mid])
+        node.left = self._build(values, lo, mid)
+        node.right = self._build(values, mid + 1, hi)
+        self._update(node)
+        return node
+    
+    # Multiset operations: a value occurring a times here and b times in
+    # other occurs max(a, b), min(a, b) or max(a - b, 0) times in the result,
+    # like collections.Counter's |, & and -. Both trees are walked in order
+    # once and the result is bulk-built, so each is O(n + m).
+    def union(self, other):
+        """New tree with the values of either tree"""
+        a, b, merged = list(self), list(other), []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            if a[i] < b[j]:
+                merged.append(a[i])
+                i += 1
+            elif b[j] < a[i]:
+                merged.append(b[j])
+                j += 1
+            else:
+                merged.append(a[i])
+                i += 1
+                j += 1
+        merged.extend(a[i:])
+        merged.extend(b[j:])
+        return type(self).from_sorted(merged)
+    
+    def intersection(self, other):
+        """New tree with the values found in both trees"""
+        a, b, merged = list(self), list(other), []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            if a[i] < b[j]:
+                i += 1
+            elif b[j] < a[i]:
+                j += 1
+            else:
+                merged.append(a[i])
+                i += 1
+                j += 1
+        return type(self).from_sorted(merged)
+    
+    def difference(self, other):
+        """New tree with the values of this tree that are not in other"""
+        a, b, merged = list(self), list(other), []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            if a[i] < b[j]:
+                merged.append(a[i])
+                i += 1
+            elif b[j] < a[i]:
+                j += 1
+            else:
+                i += 1
+                j += 1
+        merged.extend(a[i:])
+        return type(self).from_sorted(merged)
+
+class AVLNode(Node):
+    """Node class for AVL Tree, also storing the height of its subtree"""
+    __slots__ = ('height',)
+    
+    def __init__(self, value):
+        super().__init__(value)
+        self.height = 1
+
+class AVLTree(BinarySearchTree):
+    """Self-balancing Binary Search Tree (AVL tree)
+    
+    After every insert and delete the heights of the two subtrees of any node
+    differ by at most one, so the height stays below 1.44 * log2(n + 2) and
+    every operation is O(log n) even for sorted input. The API is the same
+    as BinarySearchTree.
+    """
+    _node_class = AVLNode
+    
+    def insert_iterative(self, value):
+        """Insert a value into AVL tree using iterative approach
+        Time Complexity: O(log n)
+        Space Complexity: O(log n) for the path back to the root
+        """
+        new_node = self._node_class(value)
+        if not self.root:
+            self.root = new_node
+            return
+        
+        path = []
+        current = self.root
+        while current:
+            path.append(current)
+            current = current.left if value < current.value else current.right
+        if value < path[-1].value:
+            path[-1].left = new_node
+        else:
+            path[-1].right = new_node
+        self._rebalance_path(path)
+    
+    def _rebalance_path(self, path):
+        """Rebalance the nodes of a root-to-leaf path, from the bottom up"""
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            new_top = self._rebalance(node)
+            if new_top is not node:
+                if i == 0:
+                    self.root = new_top
+                elif path[i - 1].left is node:
+                    path[i - 1].left = new_top
+                else:
+                    path[i - 1].right = new_top
+    
+    def height(self):
+        """Number of levels in the tree (0 when empty)
+        Time Complexity: O(1)
+        """
+        return self._height(self.root)
+    
+    @staticmethod
+    def _height(node):
+        return node.height if node else 0
+    
+    def _update(self, node):
+        """Recompute the cached fields of a node from its children"""
+        super()._update(node)
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+    
+    def _rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+    
+    def _rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update(node)
+        self._update(pivot)
+        return pivot
+    
+    def _rebalance(self, node):
+        """Restore the AVL property at node with at most two rotations"""
+        self._update(node)
+        balance = self._height(node.left) - self._height(node.right)
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if self._height(node.right.right) < self._height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+_write_versions = itertools.count(1)  # shared by all trees, so snapshots never clash
+
+class VersionedNode(AVLNode):
+    """Node class for ConcurrentBinarySearchTree, stamped with the write that created it"""
+    __slots__ = ('version',)
+    
+    def __init__(self, value, version=0):
+        super().__init__(value)
+        self.version = version
+
+class ConcurrentBinarySearchTree(AVLTree):
+    """Thread-safe AVL tree: lock-free reads, serialized writes, O(1) snapshots
+    
+    Nodes are never changed once they are reachable from the root. A write
+    copies the nodes on its root-to-leaf path (and any it rotates), builds
+    the new version next to the old one and publishes it with a single
+    assignment to self.root. Writers take a lock; readers take no lock at
+    all, they just read self.root once and walk an immutable tree, so they
+    run concurrently with writers and always see a consistent version.
+    
+    Every write draws a new version number and stamps the nodes it creates
+    with it; only nodes carrying the current stamp may be changed in place.
+    
+    snapshot() shares the current root in O(1); it can be iterated at leisure
+    while writers continue, and writing to it does not affect the original.
+    A write costs O(log n) extra node copies.
+    """
+    _node_class = VersionedNode
+    
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._version = 0  # stamp of the write in progress
+    
+    def snapshot(self):
+        """Point-in-time copy of the tree in O(1)"""
+        copy = type(self)()
+        copy.root = self.root
+        return copy
+    
+    def insert_iterative(self, value):
+        """Insert a value (same as insert_recursive: the path is copied on the way down)
+        Time Complexity: O(log n)
+        """
+        self.insert_recursive(value)
+    
+    def insert_recursive(self, value):
+        with self._lock:
+            self._version = next(_write_versions)
+            self.root = self._insert_recursive(self.root, value)
+    
+    def delete(self, value):
+        with self._lock:
+            self._version = next(_write_versions)
+            self.root = self._delete_recursive(self.root, value)
+    
+    def _own(self, node):
+        """Return a copy of node the current write may change (node itself if it is new)"""
+        if node is None or node.version == self._version:
+            return node
+        copy = VersionedNode(node.value, self._version)
+        copy.left, copy.right = node.left, node.right
+        copy.size, copy.height = node.size, node.height
+        return copy
+    
+    def _insert_recursive(self, node, value):
+        if not node:
+            return VersionedNode(value, self._version)
+        return super()._insert_recursive(self._own(node), value)
+    
+    def _delete_recursive(self, node, value):
+        if not node:
+            return None
+        return super()._delete_recursive(self._own(node), value)
+    
+    def _rotate_left(self, node):
+        node = self._own(node)
+        node.right = self._own(node.right)
+        return super()._rotate_left(node)
+    
+    def _rotate_right(self, node):
+        node = self._own(node)
+        node.left = self._own(node.left)
+        return super()._rotate_right(node)
+    
+    # Queries that walk from the root more than once run on one snapshot
+    def select(self, k):
+        return AVLTree.select(self.snapshot(), k)
+    
+    def count_range(self, lo, hi):
+        return AVLTree.count_range(self.snapshot(), lo, hi)
+
+_MISSING = object()
+
+class MapNode(AVLNode):
+    """Node class for TreeMap: value is the key, payload the mapped value"""
+    __slots__ = ('payload',)
+    
+    def __init__(self, value, payload=None):
+        super().__init__(value)
+        self.payload = payload
+
+class TreeMap(AVLTree):
+    """Sorted map (key -> payload) on an AVL tree
+    
+    Keys are unique and kept in sorted order; iterating yields the keys.
+    Besides the dict-style methods there are batch operations that sort the
+    batch once and split it at every node on the way down, so keys sharing a
+    path prefix share the walk: a batch of k keys visits O(k log(n/k + 1))
+    nodes instead of O(k log n). Batched inserts and deletes put subtrees
+    back together with AVL joins, so the tree stays balanced.
+    """
+    _node_class = MapNode
+    
+    def _find(self, key):
+        current = self.root
+        while current:
+            if key == current.value:
+                return current
+            current = current.left if key < current.value else current.right
+        return None
     
-    def _preorder_recursive(self, node, result):
-        if node:
-            result.append(node.value)
-            self._preorder_recursive(node.left, result)
-            self._preorder_recursive(node.right, result)
+    def _copy_entry(self, source, target):
+        target.value = source.value
+        target.payload = source.payload
+    
+    # Dict-style access, each O(log n)
+    def __getitem__(self, key):
+        node = self._find(key)
+        if node is None:
+            raise KeyError(key)
+        return node.payload
+    
+    def __setitem__(self, key, payload):
+        path = []
+        current = self.root
+        while current:
+            if key == current.value:
+                current.payload = payload
+                return
+            path.append(current)
+            current = current.left if key < current.value else current.right
+        new_node = MapNode(key, payload)
+        if not path:
+            self.root = new_node
+            return
+        if key < path[-1].value:
+            path[-1].left = new_node
+        else:
+            path[-1].right = new_node
+        self._rebalance_path(path)
+    
+    def __delitem__(self, key):
+        if self._find(key) is None:
+            raise KeyError(key)
+        self.delete(key)
+    
+    def __contains__(self, key):
+        return self._find(key) is not None
+    
+    def insert_iterative(self, key, payload=None):
+        """Set key to payload (keys are unique, so inserting again overwrites)"""
+        self[key] = payload
+    
+    def insert_recursive(self, key, payload=None):
+        self[key] = payload
+    
+    def get(self, key, default=None):
+        node = self._find(key)
+        return default if node is None else node.payload
+    
+    def setdefault(self, key, default=None):
+        node = self._find(key)
+        if node is not None:
+            return node.payload
+        self[key] = default
+        return default
+    
+    def pop(self, key, default=_MISSING):
+        node = self._find(key)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        payload = node.payload
+        self.delete(key)
+        return payload
+    
+    def keys(self):
+        return self.iter_inorder()
+    
+    def values(self):
+        return (payload for _, payload in self.items())
+    
+    def items(self):
+        """Yield (key, payload) pairs in key order"""
+        stack = []
+        current = self.root
+        while stack or current:
+            while current:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            yield current.value, current.payload
+            current = current.right
+    
+    # Bulk Operations
+    @classmethod
+    def from_sorted(cls, items):
+        """Build a balanced map from (key, payload) pairs in ascending key order
+        Time Complexity: O(n)
+        """
+        items = list(items)
+        for i in range(1, len(items)):
+            if not items[i - 1][0] < items[i][0]:
+                raise ValueError("from_sorted() needs distinct keys in ascending order")
+        tree = cls()
+        tree.root = tree._build(items, 0, len(items))
+        return tree
+    
+    @classmethod
+    def from_unsorted(cls, items):
+        """Build a balanced map from (key, payload) pairs; later pairs win
+        Time Complexity: O(n log n)
+        """
+        return cls.from_sorted(sorted(dict(items).items()))
+    
+    def _build(self, items, lo, hi):
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = MapNode(*items[mid])
+        node.left = self._build(items, lo, mid)
+        node.right = self._build(items, mid + 1, hi)
+        self._update(node)
+        return node
+    
+    # Set operations keep the pairs of the keys in the result; for keys in
+    # both maps, union takes the payload from other (like dict.update)
+    def union(self, other):
+        return self._merge(other, True, True, True)
+    
+    def intersection(self, other):
+        return self._merge(other, False, True, False)
+    
+    def difference(self, other):
+        return self._merge(other, True, False, False)
+    
+    def _merge(self, other, keep_self, keep_both, keep_other):
+        a, b, merged = list(self.items()), list(other.items()), []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            if a[i][0] < b[j][0]:
+                if keep_self:
+                    merged.append(a[i])
+                i += 1
+            elif b[j][0] < a[i][0]:
+                if keep_other:
+                    merged.append(b[j])
+                j += 1
+            else:
+                if keep_both:
+                    merged.append(a[i] if not keep_other else b[j])
+                i += 1
+                j += 1
+        if keep_self:
+            merged.extend(a[i:])
+        if keep_other:
+            merged.extend(b[j:])
+        return type(self).from_sorted(merged)
+    
+    # Batch operations
+    def search_many(self, keys, default=None):
+        """
+        Look up many keys in one shared descent.
+        
+        Returns:
+            List with the payload of keys[i] at position i, or default
+            where the key is not in the map (like get)
+        """
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        batch = [keys[i] for i in order]
+        found = [default] * len(keys)
+        self._search_batch(self.root, batch, order, 0, len(batch), found)
+        return found
+    
+    def _search_batch(self, node, batch, order, lo, hi, found):
+        if node is None or lo >= hi:
+            return
+        if hi - lo == 1:
+            # A single key left: finish with a plain descent
+            key = batch[lo]
+            while node:
+                if key == node.value:
+                    found[order[lo]] = node.payload
+                    return
+                node = node.left if key < node.value else node.right
+            return
+        i = bisect_left(batch, node.value, lo, hi)
+        j = bisect_right(batch, node.value, i, hi)
+        for p in range(i, j):
+            found[order[p]] = node.payload
+        self._search_batch(node.left, batch, order, lo, i, found)
+        self._search_batch(node.right, batch, order, j, hi, found)
+    
+    def insert_many(self, items):
+        """
+        Set many keys at once from (key, payload) pairs or a mapping.
+        When a key repeats in the batch the last payload wins.
+        """
+        batch = sorted(dict(items).items())
+        keys = [key for key, _ in batch]
+        self.root = self._insert_batch(self.root, batch, keys, 0, len(batch))
+    
+    def _insert_batch(self, node, batch, keys, lo, hi):
+        if lo >= hi:
+            return node
+        if node is None:
+            return self._build(batch, lo, hi)
+        i = bisect_left(keys, node.value, lo, hi)
+        j = i + (i < hi and keys[i] == node.value)
+        if j > i:
+            node.payload = batch[i][1]
+        left = self._insert_batch(node.left, batch, keys, lo, i)
+        right = self._insert_batch(node.right, batch, keys, j, hi)
+        return self._join(left, node, right)
+    
+    def delete_many(self, keys):
+        """
+        Delete many keys at once; keys that are absent are ignored.
+        
+        Returns:
+            Number of keys deleted
+        """
+        batch = sorted(set(keys))
+        before = len(self)
+        self.root = self._delete_batch(self.root, batch, 0, len(batch))
+        return before - len(self)
+    
+    def _delete_batch(self, node, batch, lo, hi):
+        if node is None or lo >= hi:
+            return node
+        i = bisect_left(batch, node.value, lo, hi)
+        j = i + (i < hi and batch[i] == node.value)
+        left = self._delete_batch(node.left, batch, lo, i)
+        right = self._delete_batch(node.right, batch, j, hi)
+        if j > i:
+            return self._join_trees(left, right)
+        return self._join(left, node, right)
+    
+    def _join(self, left, mid, right):
+        """Balanced tree of left, then node mid, then right (any heights)"""
+        if self._height(left) > self._height(right) + 1:
+            left.right = self._join(left.right, mid, right)
+            return self._rebalance(left)
+        if self._height(right) > self._height(left) + 1:
+            right.left = self._join(left, mid, right.left)
+            return self._rebalance(right)
+        mid.left, mid.right = left, right
+        self._update(mid)
+        return mid
+    
+    def _join_trees(self, left, right):
+        """Balanced tree of left then right, without a middle node"""
+        if left is None:
+            return right
+        left, last = self._split_last(left)
+        return self._join(left, last, right)
+    
+    def _split_last(self, node):
+        """Remove the largest node of a subtree: returns (rest, that node)"""
+        if node.right is None:
+            return node.left, node
+        rest, last = self._split_last(node.right)
+        return self._join(node.left, node, rest), last
+
+NIL = -1  # "no child" index in ArenaBinarySearchTree
+
+class ArenaBinarySearchTree:
+    """Binary Search Tree stored in parallel arrays instead of Node objects
+    
+    Node i is values[i], with child indices left[i] and right[i] (NIL when
+    missing), all kept in array.array buffers. A key then costs 8 bytes plus
+    16 bytes of links instead of a separate Python object, and nodes created
+    together sit next to each other in memory. Deleted slots are chained into
+    a free list through their left index and reused by later inserts.
+    
+    Values must fit the typecode ('q' for 64-bit ints, 'd' for floats). The
+    API is the same as BinarySearchTree; nothing recurses except the
+    *_recursive methods, so degenerate trees are fine.
+    """
+    def __init__(self, typecode='q'):
+        self.values = array(typecode)
+        self.left = array('q')
+        self.right = array('q')
+        self.root = NIL
+        self._free = NIL  # head of the free-slot list
+        self._count = 0
+    
+    def __len__(self):
+        return self._count
+    
+    def _new_node(self, value):
+        """Store value in a free slot, or a new one, and return its index"""
+        self._count += 1
+        i = self._free
+        if i != NIL:
+            self._free = self.left[i]
+            self.values[i] = value
+            self.left[i] = self.right[i] = NIL
+            return i
+        self.values.append(value)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        return len(self.values) - 1
+    
+    def _release(self, i):
+        """Push slot i onto the free list"""
+        self._count -= 1
+        self.left[i] = self._free
+        self.right[i] = NIL
+        self._free = i
+    
+    def insert_iterative(self, value):
+        """Insert a value using iterative approach
+        Time Complexity: O(h) where h is height of tree
+        Space Complexity: O(1)
+        """
+        new = self._new_node(value)
+        if self.root == NIL:
+            self.root = new
+            return
+        
+        values, left, right = self.values, self.left, self.right
+        current = self.root
+        while True:
+            if value < values[current]:
+                if left[current] == NIL:
+                    left[current] = new
+                    break
+                current = left[current]
+            else:
+                if right[current] == NIL:
+                    right[current] = new
+                    break
+                current = right[current]
+    
+    def insert_recursive(self, value):
+        """Insert a value using recursive approach
+        Time Complexity: O(h) where h is height of tree
+        Space Complexity: O(h) due to recursive call stack
+        """
+        self.root = self._insert_recursive(self.root, value)
+    
+    def _insert_recursive(self, i, value):
+        if i == NIL:
+            return self._new_node(value)
+        if value < self.values[i]:
+            self.left[i] = self._insert_recursive(self.left[i], value)
+        else:
+            self.right[i] = self._insert_recursive(self.right[i], value)
+        return i
+    
+    def search_iterative(self, value):
+        """Search for a value using iterative approach
+        Time Complexity: O(h) where h is height of tree
+        Space Complexity: O(1)
+        """
+        values, left, right = self.values, self.left, self.right
+        current = self.root
+        while current != NIL:
+            if value == values[current]:
+                return True
+            current = left[current] if value < values[current] else right[current]
+        return False
+    
+    def search_recursive(self, value):
+        """Search for a value using recursive approach
+        Time Complexity: O(h) where h is height of tree
+        Space Complexity: O(h) due to recursive call stack
+        """
+        return self._search_recursive(self.root, value)
+    
+    def _search_recursive(self, i, value):
+        if i == NIL:
+            return False
+        if value == self.values[i]:
+            return True
+        if value < self.values[i]:
+            return self._search_recursive(self.left[i], value)
+        return self._search_recursive(self.right[i], value)
+    
+    def delete(self, value):
+        """Delete a value, returning its slot to the free list
+        Time Complexity: O(h) where h is height of tree
+        Space Complexity: O(1)
+        """
+        values, left, right = self.values, self.left, self.right
+        parent, current = NIL, self.root
+        while current != NIL and values[current] != value:
+            parent = current
+            current = left[current] if value < values[current] else right[current]
+        if current == NIL:
+            return
+        
+        # Node with two children: take the value of the inorder successor
+        # and unlink the successor instead, which has no left child
+        if left[current] != NIL and right[current] != NIL:
+            parent, successor = current, right[current]
+            while left[successor] != NIL:
+                parent, successor = successor, left[successor]
+            values[current] = values[successor]
+            current = successor
+        
+        child = left[current] if left[current] != NIL else right[current]
+        if parent == NIL:
+            self.root = child
+        elif left[parent] == current:
+            left[parent] = child
+        else:
+            right[parent] = child
+        self._release(current)
+    
+    # Tree Traversal Methods
+    def inorder(self):
+        """Inorder traversal: Left -> Root -> Right"""
+        return list(self.iter_inorder())
+    
+    def preorder(self):
+        """Preorder traversal: Root -> Left -> Right"""
+        return list(self.iter_preorder())
     
     def postorder(self):
         """Postorder traversal: Left -> Right -> Root"""
-        result = []
-        self._postorder_recursive(self.root, result)
-        return result
-    
-    def _postorder_recursive(self, node, result):
-        if node:
-            self._postorder_recursive(node.left, result)
-            self._postorder_recursive(node.right, result)
-            result.append(node.value)
+        return list(self.iter_postorder())
+    
+    def __iter__(self):
+        return self.iter_inorder()
+    
+    def __reversed__(self):
+        return self.iter_inorder(reverse=True)
+    
+    def iter_inorder(self, reverse=False):
+        """Yield values in sorted order (descending with reverse=True)"""
+        values = self.values
+        near, far = (self.right, self.left) if reverse else (self.left, self.right)
+        stack = []
+        current = self.root
+        while stack or current != NIL:
+            while current != NIL:
+                stack.append(current)
+                current = near[current]
+            current = stack.pop()
+            yield values[current]
+            current = far[current]
+    
+    def iter_preorder(self):
+        """Yield values Root -> Left -> Right"""
+        values, left, right = self.values, self.left, self.right
+        stack = [self.root] if self.root != NIL else []
+        while stack:
+            i = stack.pop()
+            yield values[i]
+            if right[i] != NIL:
+                stack.append(right[i])
+            if left[i] != NIL:
+                stack.append(left[i])
+    
+    def iter_postorder(self):
+        """Yield values Left -> Right -> Root"""
+        values, left, right = self.values, self.left, self.right
+        stack = []
+        current, last = self.root, NIL
+        while stack or current != NIL:
+            while current != NIL:
+                stack.append(current)
+                current = left[current]
+            i = stack[-1]
+            if right[i] != NIL and right[i] != last:
+                current = right[i]
+            else:
+                stack.pop()
+                yield values[i]
+                last = i
+    
+    def items_between(self, lo, hi):
+        """Yield the values v with lo <= v <= hi in sorted order, in O(h + k)"""
+        values, left, right = self.values, self.left, self.right
+        stack = []
+        current = self.root
+        while stack or current != NIL:
+            while current != NIL:
+                if values[current] < lo:
+                    current = right[current]
+                else:
+                    stack.append(current)
+                    current = left[current]
+            if not stack:
+                return
+            i = stack.pop()
+            if values[i] > hi:
+                return
+            yield values[i]
+            current = right[i]
+    
+    def height(self):
+        """Number of levels in the tree (0 when empty)
+        Time Complexity: O(n)
+        """
+        levels = 0
+        level = [self.root] if self.root != NIL else []
+        while level:
+            levels += 1
+            level = [c for i in level for c in (self.left[i], self.right[i]) if c != NIL]
+        return levels
 
 def run_test_case(bst, operations, test_name):
     """Helper function to run test cases"""
@@ -205,11 +1179,17 @@ def main():
         print("2. Deletion Test Cases")
         print("3. Empty Tree Operations")
         print("4. Single Node Operations")
-        print("5. Exit")
+        print("5. Sorted Inserts (Plain vs AVL Tree)")
+        print("6. Array-Backed Tree Memory")
+        print("7. Order Statistics")
+        print("8. Bulk Load and Set Operations")
+        print("9. Concurrent Tree Snapshots")
+        print("10. Sorted Map and Batch Operations")
+        print("11. Exit")
         
-        choice = input("\nEnter your choice (1-5): ").strip()
+        choice = input("\nEnter your choice (1-11): ").strip()
         
-        if choice == "5":
+        if choice == "11":
             print("\nThank you for using BST Demo!")
             break
         
@@ -252,8 +1232,83 @@ def main():
             ]
             run_test_case(bst, operations, "Single Node Operations")
         
+        elif choice == "5":
+            # Sorted input turns a plain BST into a chain, the AVL tree stays balanced
+            avl = AVLTree()
+            for value in range(1, 1001):
+                bst.insert_iterative(value)
+                avl.insert_iterative(value)
+            print(f"\nInserted 1..1000 in order")
+            print(f"Plain BST height: {bst.height()}")
+            print(f"AVL tree height:  {avl.height()}")
+            for value in range(1, 1001, 2):
+                avl.delete(value)
+            print(f"AVL tree height after deleting the odd values: {avl.height()}")
+            print(f"AVL inorder starts: {avl.inorder()[:10]}")
+        
+        elif choice == "6":
+            import random
+            import tracemalloc
+            
+            values = random.sample(range(10 ** 9), 100_000)
+            for tree in (BinarySearchTree(), ArenaBinarySearchTree()):
+                tracemalloc.start()
+                for value in values:
+                    tree.insert_iterative(value)
+                used = tracemalloc.get_traced_memory()[0]
+                tracemalloc.stop()
+                print(f"\n{type(tree).__name__}: {used / len(values):.1f} bytes per key")
+                print(f"Inorder sorted: {tree.inorder() == sorted(values)}")
+        
+        elif choice == "7":
+            avl = AVLTree()
+            for value in [50, 30, 70, 20, 40, 60, 80]:
+                avl.insert_iterative(value)
+            print(f"\nValues:            {avl.inorder()}")
+            print(f"select(2):         {avl.select(2)}")
+            print(f"rank(65):          {avl.rank(65)}")
+            print(f"count_range(25, 65): {avl.count_range(25, 65)}")
+            print(f"floor(65):         {avl.floor(65)}")
+            print(f"ceiling(65):       {avl.ceiling(65)}")
+            print(f"predecessor(50):   {avl.predecessor(50)}")
+            print(f"successor(50):     {avl.successor(50)}")
+        
+        elif choice == "8":
+            first = BinarySearchTree.from_sorted([10, 20, 20, 30, 40, 50, 60])
+            second = BinarySearchTree.from_unsorted([60, 20, 35, 10, 70])
+            print(f"\nFirst:  {first.inorder()} (height {first.height()})")
+            print(f"Second: {second.inorder()} (height {second.height()})")
+            print(f"Union:        {first.union(second).inorder()}")
+            print(f"Intersection: {first.intersection(second).inorder()}")
+            print(f"Difference:   {first.difference(second).inorder()}")
+        
+        elif choice == "9":
+            shared = ConcurrentBinarySearchTree()
+            writers = [threading.Thread(target=lambda start=start: [shared.insert_iterative(v)
+                                                                   for v in range(start, 1000, 4)])
+                       for start in range(4)]
+            for writer in writers:
+                writer.start()
+            snapshot = shared.snapshot()  # taken while the writers are running
+            for writer in writers:
+                writer.join()
+            print(f"\nSnapshot taken mid-write: {len(snapshot)} values, sorted: {snapshot.inorder() == sorted(snapshot)}")
+            print(f"Final tree: {len(shared)} values, height {shared.height()}")
+        
+        elif choice == "10":
+            ages = TreeMap()
+            ages["carol"] = 35
+            ages.insert_many([("alice", 30), ("bob", 25), ("dave", 41)])
+            print(f"\nItems:            {list(ages.items())}")
+            print(f"ages['bob']:      {ages['bob']}")
+            print(f"get('eve', 0):    {ages.get('eve', 0)}")
+            print(f"search_many:      {ages.search_many(['dave', 'eve', 'alice'], default=0)}")
+            print(f"pop('carol'):     {ages.pop('carol')}")
+            print(f"delete_many:      {ages.delete_many(['alice', 'eve'])} deleted")
+            print(f"Items:            {list(ages.items())}")
+        
         else:
-            print("\nInvalid choice! Please enter a number between 1 and 5.")
+            print("\nInvalid choice! Please enter a number between 1 and 11.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
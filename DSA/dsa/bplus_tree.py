@@ -0,0 +1,417 @@
+"""
+Disk-backed B+ Tree
+
+A persistent index of 64-bit integer keys stored in a file of fixed-size
+pages, with the same insert/search/delete/inorder surface as
+BinarySearchTree. Opening a tree only reads its header page, and a search
+reads one page per level (about 4 levels for 10^9 keys with 4 KB pages), so
+datasets larger than RAM can be searched directly from disk.
+
+- Page 0 is the header; every other page is one node. Leaves hold sorted
+  keys with a repeat count each (so duplicates behave as in
+  BinarySearchTree) and a link to the next leaf; internal pages hold
+  separator keys and child page numbers.
+- Pages are read through a memory map of the file and decoded into an LRU
+  cache of cache_pages nodes.
+- Changes stay in the cache until a checkpoint. Every insert and delete is
+  first appended to a write-ahead log (path + "-wal"). A checkpoint logs
+  the images of all dirty pages followed by a commit marker, then writes
+  them into the file and empties the log. After a crash, opening the tree
+  finishes a committed checkpoint from the log, or replays the logged
+  operations on the last checkpointed state.
+- Deletes are lazy: keys are removed from their leaf but pages are never
+  merged or freed, which keeps every separator valid.
+
+Keys are stored in native byte order, like MappedRecords in binary_search.py.
+
+Usage:
+    with BPlusTree("ids.db") as tree:
+        tree.insert(42)
+        tree.search(42)          # True
+        list(tree.items_between(10, 50))
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+PAGE_SIZE = 4096
+CACHE_PAGES = 256  # decoded pages kept in memory
+
+MAGIC = b"BPTREE01"
+HEADER = struct.Struct("8sIqqqq")  # magic, page size, root, page count, size, first leaf
+NODE = struct.Struct("Bxxxiq")     # is_leaf, key count, next leaf (-1 for none)
+NO_PAGE = -1
+
+WAL_INSERT = b"I"
+WAL_DELETE = b"D"
+WAL_PAGE = b"P"
+WAL_COMMIT = b"C"
+WAL_KEY = struct.Struct("q")
+
+
+class _Page:
+    """Decoded node: keys plus repeat counts (leaf) or child pages (internal)."""
+    __slots__ = ('page_no', 'leaf', 'keys', 'values', 'next', 'dirty')
+
+    def __init__(self, page_no, leaf, keys, values, next=NO_PAGE):
+        self.page_no = page_no
+        self.leaf = leaf
+        self.keys = keys
+        self.values = values
+        self.next = next
+        self.dirty = False
+
+
+class BPlusTree:
+    """Persistent B+ tree of int64 keys with an LRU page cache and a WAL"""
+
+    def __init__(self, path, page_size=PAGE_SIZE, cache_pages=CACHE_PAGES, sync=True):
+        """
+        Open the tree stored at path, creating it if needed.
+
+        Args:
+            path: Data file; the log is kept next to it in path + "-wal"
+            page_size: Bytes per page for a new file (an existing file keeps its own)
+            cache_pages: Number of decoded pages kept in memory
+            sync: fsync the log after every operation (durable but slower)
+        """
+        self.path = path
+        self.cache_pages = cache_pages
+        self.sync = sync
+        self.page_reads = 0  # pages decoded from the file, for measuring searches
+        self._cache = OrderedDict()
+        self._map = None
+
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, "w+b" if new else "r+b")
+        if new:
+            self._set_page_size(page_size)
+            self.root, self.page_count, self.size, self.first_leaf = 1, 2, 0, 1
+            root = _Page(1, True, [], [])
+            root.dirty = True
+            self._cache[1] = root
+            self._wal = open(path + "-wal", "wb")
+            self.checkpoint()
+        else:
+            self._read_header()
+            self._wal = open(path + "-wal", "a+b")
+            self._recover()
+
+    # Page layout
+    def _set_page_size(self, page_size):
+        self.page_size = page_size
+        self.leaf_capacity = (page_size - NODE.size) // 16
+        self.internal_capacity = (page_size - NODE.size - 8) // 16
+        if self.internal_capacity < 3:
+            raise ValueError("page_size is too small")
+
+    def _read_header(self):
+        self._remap()
+        magic, page_size, self.root, self.page_count, self.size, self.first_leaf = \
+            HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a B+ tree file")
+        self._set_page_size(page_size)
+
+    def _header_bytes(self):
+        page = bytearray(self.page_size)
+        HEADER.pack_into(page, 0, MAGIC, self.page_size, self.root,
+                         self.page_count, self.size, self.first_leaf)
+        return page
+
+    def _encode(self, page):
+        buf = bytearray(self.page_size)
+        n = len(page.keys)
+        NODE.pack_into(buf, 0, page.leaf, n, page.next)
+        start = NODE.size
+        buf[start:start + 8 * n] = array('q', page.keys).tobytes()
+        start += 8 * (self.leaf_capacity if page.leaf else self.internal_capacity)
+        values = array('q', page.values).tobytes()
+        buf[start:start + len(values)] = values
+        return buf
+
+    def _decode(self, page_no, buf):
+        leaf, n, next_leaf = NODE.unpack_from(buf, 0)
+        start = NODE.size
+        keys = array('q', buf[start:start + 8 * n]).tolist()
+        start += 8 * (self.leaf_capacity if leaf else self.internal_capacity)
+        count = n if leaf else n + 1
+        values = array('q', buf[start:start + 8 * count]).tolist()
+        return _Page(page_no, bool(leaf), keys, values, next_leaf)
+
+    def _remap(self):
+        """Map the data file again after it was written or grew."""
+        if self._map is not None:
+            self._map.close()
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    # Page cache
+    def _page(self, page_no):
+        """Return a page, decoding it from the mapped file on a cache miss."""
+        page = self._cache.get(page_no)
+        if page is not None:
+            self._cache.move_to_end(page_no)
+            return page
+        start = page_no * self.page_size
+        page = self._decode(page_no, self._map[start:start + self.page_size])
+        self.page_reads += 1
+        self._cache[page_no] = page
+        return page
+
+    def _evict(self):
+        """
+        Drop least recently used clean pages; dirty ones wait for a checkpoint.
+
+        Only called between operations, so pages an operation holds are
+        never dropped under it.
+        """
+        if len(self._cache) <= self.cache_pages:
+            return
+        for page_no in list(self._cache):
+            if len(self._cache) <= self.cache_pages:
+                return
+            if not self._cache[page_no].dirty:
+                del self._cache[page_no]
+        # Everything left is dirty: write it out so it can be evicted
+        self.checkpoint()
+
+    def _new_page(self, leaf, keys, values, next=NO_PAGE):
+        page = _Page(self.page_count, leaf, keys, values, next)
+        page.dirty = True
+        self.page_count += 1
+        self._cache[page.page_no] = page
+        return page
+
+    # Write-ahead log
+    def _log(self, record):
+        self._wal.write(record)
+        self._wal.flush()
+        if self.sync:
+            os.fsync(self._wal.fileno())
+
+    def checkpoint(self):
+        """
+        Write all changes into the data file and empty the log.
+
+        The dirty pages are logged and committed first, so a crash while
+        the data file is being written is repaired on the next open.
+        """
+        dirty = [page for page in self._cache.values() if page.dirty]
+        images = [(page.page_no, self._encode(page)) for page in dirty]
+        images.append((0, self._header_bytes()))
+        for page_no, image in images:
+            self._wal.write(WAL_PAGE + WAL_KEY.pack(page_no) + image)
+        self._log(WAL_COMMIT)
+        self._apply(images)
+        for page in dirty:
+            page.dirty = False
+        self._evict()
+
+    def _apply(self, images):
+        """Write committed page images into the data file and empty the log."""
+        for page_no, image in images:
+            self._file.seek(page_no * self.page_size)
+            self._file.write(image)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._remap()
+        self._wal.seek(0)
+        self._wal.truncate()
+        self._wal.flush()
+        os.fsync(self._wal.fileno())
+
+    def _recover(self):
+        """Finish or replay whatever the log holds from before a crash."""
+        self._wal.seek(0)
+        log = self._wal.read()
+        ops, images, pos = [], [], 0
+        while pos < len(log):
+            kind = log[pos:pos + 1]
+            if kind in (WAL_INSERT, WAL_DELETE) and pos + 9 <= len(log):
+                ops.append((kind, WAL_KEY.unpack_from(log, pos + 1)[0]))
+                pos += 9
+            elif kind == WAL_PAGE and pos + 9 + self.page_size <= len(log):
+                page_no = WAL_KEY.unpack_from(log, pos + 1)[0]
+                images.append((page_no, log[pos + 9:pos + 9 + self.page_size]))
+                pos += 9 + self.page_size
+            elif kind == WAL_COMMIT:
+                # The logged operations are part of these pages already
+                self._apply(images)
+                self._read_header()
+                return
+            else:
+                break  # torn tail of the last write
+        # No committed checkpoint: the data file still holds the last one
+        self._wal.seek(0)
+        self._wal.truncate()
+        for kind, key in ops:
+            if kind == WAL_INSERT:
+                self.insert(key)
+            else:
+                self.delete(key)
+        if ops:
+            self.checkpoint()
+
+    # Tree operations
+    def _find_leaf(self, key, path=None):
+        """Descend to the leaf that holds key, recording internal pages in path."""
+        self._evict()
+        page = self._page(self.root)
+        while not page.leaf:
+            if path is not None:
+                path.append(page)
+            page = self._page(page.values[bisect_right(page.keys, key)])
+        return page
+
+    def __len__(self):
+        return self.size
+
+    def search(self, key):
+        """Search for a key
+        Time Complexity: O(log n) with one page read per level
+        """
+        return self.count(key) > 0
+
+    def count(self, key):
+        """Number of times key was inserted (and not deleted)"""
+        leaf = self._find_leaf(key)
+        i = bisect_left(leaf.keys, key)
+        return leaf.values[i] if i < len(leaf.keys) and leaf.keys[i] == key else 0
+
+    def insert(self, key):
+        """Insert a key (duplicates are counted)
+        Time Complexity: O(log n)
+        """
+        path = []
+        leaf = self._find_leaf(key, path)
+        self._log(WAL_INSERT + WAL_KEY.pack(key))
+        leaf.dirty = True
+        self.size += 1
+        i = bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            leaf.values[i] += 1
+            return
+        leaf.keys.insert(i, key)
+        leaf.values.insert(i, 1)
+        if len(leaf.keys) <= self.leaf_capacity:
+            return
+
+        # Split the leaf, then any internal pages that overflow in turn
+        mid = len(leaf.keys) // 2
+        right = self._new_page(True, leaf.keys[mid:], leaf.values[mid:], leaf.next)
+        del leaf.keys[mid:], leaf.values[mid:]
+        leaf.next = right.page_no
+        separator, child = right.keys[0], right.page_no
+        while path:
+            parent = path.pop()
+            parent.dirty = True
+            i = bisect_right(parent.keys, separator)
+            parent.keys.insert(i, separator)
+            parent.values.insert(i + 1, child)
+            if len(parent.keys) <= self.internal_capacity:
+                return
+            mid = len(parent.keys) // 2
+            separator = parent.keys[mid]
+            right = self._new_page(False, parent.keys[mid + 1:], parent.values[mid + 1:])
+            del parent.keys[mid:], parent.values[mid + 1:]
+            child = right.page_no
+        # The root itself was split
+        self.root = self._new_page(False, [separator], [self.root, child]).page_no
+
+    insert_iterative = insert
+    search_iterative = search
+
+    def delete(self, key):
+        """Delete one occurrence of a key (nothing happens if it is absent)
+        Time Complexity: O(log n)
+        """
+        leaf = self._find_leaf(key)
+        i = bisect_left(leaf.keys, key)
+        if i == len(leaf.keys) or leaf.keys[i] != key:
+            return
+        self._log(WAL_DELETE + WAL_KEY.pack(key))
+        leaf.dirty = True
+        self.size -= 1
+        leaf.values[i] -= 1
+        if not leaf.values[i]:
+            del leaf.keys[i], leaf.values[i]
+
+    # Traversals follow the leaf chain, reading each leaf once
+    def __iter__(self):
+        return self.items_between(None, None)
+
+    def inorder(self):
+        """All keys in sorted order"""
+        return list(self)
+
+    def items_between(self, lo, hi):
+        """Yield the keys k with lo <= k <= hi in sorted order (None for no bound)
+        Time Complexity: O(log n + k / B) page reads for k keys, B per leaf
+        """
+        if lo is None:
+            page_no, i = self.first_leaf, 0
+        else:
+            leaf = self._find_leaf(lo)
+            page_no, i = leaf.page_no, bisect_left(leaf.keys, lo)
+        while page_no != NO_PAGE:
+            self._evict()
+            leaf = self._page(page_no)
+            for j in range(i, len(leaf.keys)):
+                key = leaf.keys[j]
+                if hi is not None and key > hi:
+                    return
+                for _ in range(leaf.values[j]):
+                    yield key
+            page_no, i = leaf.next, 0
+
+    def height(self):
+        """Number of page levels"""
+        self._evict()
+        levels, page = 1, self._page(self.root)
+        while not page.leaf:
+            levels += 1
+            page = self._page(page.values[0])
+        return levels
+
+    def close(self):
+        """Checkpoint and close the files."""
+        self.checkpoint()
+        self._map.close()
+        self._file.close()
+        self._wal.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    import random
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "demo.db")
+        keys = random.sample(range(10 ** 9), 200_000)
+
+        with BPlusTree(path, sync=False) as tree:
+            for key in keys:
+                tree.insert(key)
+            for key in keys[:1000]:
+                tree.delete(key)
+            print(f"Inserted {len(keys)} keys, deleted 1000, height {tree.height()}")
+
+        # Reopening reads only the header; a search reads one page per level
+        with BPlusTree(path, cache_pages=16) as tree:
+            print(f"Reopened: {len(tree)} keys")
+            target = keys[5000]
+            print(f"Search {target}: {tree.search(target)} ({tree.page_reads} page reads)")
+            print(f"Search {keys[0]} (deleted): {tree.search(keys[0])}")
+            print(f"Sorted: {tree.inorder() == sorted(keys[1000:])}")
+            low = sorted(keys)[100]
+            print(f"First keys from {low}: {list(tree.items_between(low, low + 10 ** 7))[:5]}")
@@ -1,3 +1,20 @@
+import os
+import struct
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from binary_search import MappedRecords
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the other fast paths still apply
+    np = None
+
+PARALLEL_THRESHOLD = 1_000_000  # smaller inputs are searched in this process
+CHUNKS_PER_WORKER = 4           # more chunks than workers, so later ones can be skipped
+ITEM_SIZE = 8                   # bytes per item in the shared memory block
+
 """
     Perform linear search to find the target element in the array.
     
@@ -7,11 +24,28 @@
     
     Returns:
         int: Index of the target element if found, -1 otherwise
+    
+    Lists, tuples, array.array, bytes and NumPy arrays are scanned in C
+    (list.index, bytes.find, a NumPy equality mask); other sequences use
+    the plain loop below.
         
     Time Complexity: O(n) where n is the length of the array
     Space Complexity: O(1) as we only use a constant amount of extra space
 """
 def linear_search(arr: list, target: int) -> int:
+    # Fast paths: let the container scan itself in C
+    if isinstance(arr, (list, tuple, array)):
+        try:
+            return arr.index(target)
+        except (ValueError, TypeError):
+            return -1
+    if isinstance(arr, (bytes, bytearray)) and isinstance(target, int):
+        return arr.find(target) if 0 <= target < 256 else -1
+    if np is not None and isinstance(arr, np.ndarray):
+        mask = arr == target
+        i = int(mask.argmax()) if mask.size else 0
+        return i if mask.size and mask[i] else -1
+    
     # Iterate through each element in the array
     for i in range(len(arr)):
         # If current element matches target, return its index
@@ -22,6 +56,232 @@ def linear_search(arr: list, target: int) -> int:
     return -1
 
 
+"""
+    Find every index where the target element occurs.
+    
+    Args:
+        arr (list): The input array to search through
+        target (int): The element to search for
+    
+    Returns:
+        list: Indices of all matches, in increasing order
+        
+    Time Complexity: O(n)
+    Space Complexity: O(k) for k matches
+"""
+def find_all(arr: list, target: int) -> list:
+    if np is not None and isinstance(arr, np.ndarray):
+        return np.flatnonzero(arr == target).tolist()
+    if isinstance(arr, (list, tuple, array, bytes, bytearray)):
+        # Jump from match to match with the C-level index/find
+        matches = []
+        seek = arr.find if isinstance(arr, (bytes, bytearray)) else arr.index
+        i = -1
+        while True:
+            try:
+                i = seek(target, i + 1)
+            except (ValueError, TypeError):
+                break
+            if i == -1:
+                break
+            matches.append(i)
+        return matches
+    return [i for i, x in enumerate(arr) if x == target]
+
+
+
+"""
+    Find the first element for which predicate returns True.
+    
+    Args:
+        arr (list): The input array to search through
+        predicate (callable): Function taking an element and returning a bool
+    
+    Returns:
+        int: Index of the first matching element, -1 if there is none
+        
+    Time Complexity: O(n) predicate calls
+    Space Complexity: O(1)
+"""
+def find_if(arr: list, predicate) -> int:
+    for i, x in enumerate(arr):
+        if predicate(x):
+            return i
+    return -1
+
+
+
+"""
+    Perform linear search split into chunks across several processes.
+    
+    Worth it for a costly predicate over a large array. Plain equality on a
+    list, tuple, array.array, bytes or NumPy array is handed straight to
+    linear_search: its C-level scan finishes before the items could even be
+    copied to other processes.
+    
+    Otherwise the array is cut into CHUNKS_PER_WORKER chunks per worker,
+    searched in order by a pool of workers; the earliest chunk with a match
+    wins, and chunks not yet started when it is found are cancelled.
+    
+    Arrays of ints (fitting in 64 bits) or floats, including array.array
+    and NumPy arrays, are copied once into a shared memory block, so workers
+    read their chunk directly from it and only the chunk bounds are
+    pickled. The block also holds the smallest match index found so far,
+    and a worker skips its chunk when a match before it is already known.
+    Other sequences are pickled to the workers chunk by chunk. Inputs
+    shorter than threshold are searched in this process.
+    
+    Args:
+        arr: The input array to search through
+        target (int): The element to search for (ignored with predicate)
+        workers (int): Number of worker processes (defaults to the CPU count)
+        predicate (callable): Optional module-level (picklable) function to
+                              match elements with instead of == target
+        threshold (int): Minimum length before going parallel
+    
+    Returns:
+        int: Index of the earliest match if found, -1 otherwise
+        
+    Time Complexity: O(n / workers) per worker
+    Space Complexity: O(n) shared, O(n / (workers * CHUNKS_PER_WORKER)) per
+                      worker for the chunk it is searching
+"""
+def parallel_linear_search(arr, target: int = None, workers: int = None,
+                           predicate=None, threshold: int = PARALLEL_THRESHOLD) -> int:
+    workers = workers or os.cpu_count() or 1
+    n = len(arr)
+    if predicate is None and _has_fast_path(arr):
+        return linear_search(arr, target)
+    if n < threshold or workers < 2:
+        return find_if(arr, predicate) if predicate else linear_search(arr, target)
+    
+    step = -(-n // (workers * CHUNKS_PER_WORKER))
+    bounds = [(lo, min(lo + step, n)) for lo in range(0, n, step)]
+    typecode, data = _numeric_buffer(arr) if predicate else (None, None)
+    if typecode is None:
+        tasks = [(_search_chunk, (arr[lo:hi], target, predicate, lo)) for lo, hi in bounds]
+        return _first_match(tasks, workers)
+    
+    # Items followed by one int64 slot holding the earliest match found so far
+    shm = shared_memory.SharedMemory(create=True, size=(n + 1) * ITEM_SIZE)
+    try:
+        shm.buf[:n * ITEM_SIZE] = memoryview(data).cast('B')
+        del data
+        found = shm.buf[n * ITEM_SIZE:].cast('q')
+        found[0] = n
+        found.release()
+        tasks = [(_search_shared_chunk, (shm.name, typecode, n, lo, hi, predicate))
+                 for lo, hi in bounds]
+        return _first_match(tasks, workers)
+    finally:
+        shm.close()
+        shm.unlink()
+
+def _has_fast_path(arr):
+    """True if linear_search scans arr for equality in C."""
+    return isinstance(arr, (list, tuple, array, bytes, bytearray)) or (
+        np is not None and isinstance(arr, np.ndarray))
+
+def _first_match(tasks, workers):
+    """Run (function, args) tasks on a pool; return the first result != -1 in task order."""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(func, args) for func, args in tasks]
+        for future in futures:
+            result = future.result()
+            if result != -1:
+                # Tasks still queued behind the pool's workers never start
+                for later in futures:
+                    later.cancel()
+                return result
+    return -1
+
+def _search_chunk(task):
+    """Worker: search one pickled chunk and return the global index of the first match."""
+    chunk, target, predicate, offset = task
+    i = find_if(chunk, predicate) if predicate else linear_search(chunk, target)
+    return -1 if i == -1 else offset + i
+
+def _search_shared_chunk(task):
+    """Worker: search items [lo, hi) of the shared memory block with predicate."""
+    name, typecode, n, lo, hi, predicate = task
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        found = shm.buf[n * ITEM_SIZE:].cast('q')
+        try:
+            if found[0] < lo:
+                return -1  # an earlier chunk already has a match
+            chunk = array(typecode)
+            chunk.frombytes(shm.buf[lo * ITEM_SIZE:hi * ITEM_SIZE])
+            i = find_if(chunk, predicate)
+            if i == -1:
+                return -1
+            if lo + i < found[0]:
+                found[0] = lo + i
+            return lo + i
+        finally:
+            found.release()
+    finally:
+        shm.close()
+
+def _numeric_buffer(arr):
+    """
+    Return (typecode, buffer) with the items of arr as int64 ('q') or
+    float64 ('d'), or (None, None) if they are not all ints fitting in
+    64 bits or all floats.
+    """
+    if isinstance(arr, array):
+        if arr.typecode in 'qd':
+            return arr.typecode, arr
+        if arr.typecode in 'bBhHiIl':
+            return 'q', array('q', arr)
+        if arr.typecode == 'f':
+            return 'd', array('d', arr)
+        return None, None
+    if np is not None and isinstance(arr, np.ndarray):
+        kind, size = arr.dtype.kind, arr.dtype.itemsize
+        if kind in 'ib' or (kind == 'u' and size < 8):
+            return 'q', np.ascontiguousarray(arr, dtype=np.int64)
+        if kind == 'f':
+            return 'd', np.ascontiguousarray(arr, dtype=np.float64)
+        return None, None
+    if all(type(x) is int for x in arr):
+        try:
+            return 'q', array('q', arr)
+        except OverflowError:
+            return None, None
+    if all(type(x) is float for x in arr):
+        return 'd', array('d', arr)
+    return None, None
+
+
+
+"""
+    Perform linear search directly on a file of fixed-width records.
+    
+    The file is memory-mapped (see binary_search.MappedRecords) and the
+    target's encoded bytes are looked for with a C-level find over the
+    mapping, skipping matches that do not start on a record boundary.
+    Nothing is parsed into a list. Matching is by bytes, so for floats 0.0
+    and -0.0 differ and NaN can be found.
+    
+    Args:
+        path (str): File of fixed-width records
+        target (int): The record to search for (bytes when fmt is None)
+        fmt (str): struct format of one record, e.g. 'q' for int64
+        record_size (int): Record width in bytes when fmt is None
+    
+    Returns:
+        int: Index of the first matching record if found, -1 otherwise
+        
+    Time Complexity: O(n) bytes scanned
+    Space Complexity: O(1)
+"""
+def linear_search_file(path: str, target, fmt: str = 'q', record_size: int = None) -> int:
+    needle = struct.pack(fmt, target) if fmt is not None else bytes(target)
+    with MappedRecords(path, fmt, record_size) as records:
+        return records.find(needle)
+
+
 # Example usage and test cases
 if __name__ == "__main__":
     # Test case 1: Element exists in array
@@ -49,4 +309,19 @@ if __name__ == "__main__":
     print(f"\nTest Case 3:")
     print(f"Array: {test_arr3}")
     print(f"Target: {target3}")
-    print(f"Result: {'Not found' if result3 == -1 else f'Found at index {result3}'}")
\ No newline at end of file
+    print(f"Result: {'Not found' if result3 == -1 else f'Found at index {result3}'}")
+    
+    # Test case 4: All occurrences
+    test_arr4 = [3, 1, 3, 2, 3]
+    print(f"\nTest Case 4:")
+    print(f"Array: {test_arr4}")
+    print(f"Target: 3")
+    print(f"Result: Found at indices {find_all(test_arr4, 3)}")
+    
+    # Test case 5: Predicate search
+    test_arr5 = [1, 4, 2, 8, 5, 3]
+    result5 = find_if(test_arr5, lambda x: x > 4)
+    print(f"\nTest Case 5:")
+    print(f"Array: {test_arr5}")
+    print(f"Predicate: x > 4")
+    print(f"Result: {'Not found' if result5 == -1 else f'Found at index {result5}'}")
\ No newline at end of file
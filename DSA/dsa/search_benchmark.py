@@ -0,0 +1,266 @@
+"""
+Search Benchmark
+
+Measures the search functions in binary_search.py and linear_search.py on
+reproducible sorted arrays, for several sizes, hit ratios and key
+distributions, and writes the results as JSON.
+
+For each (algorithm, distribution, size, hit ratio) it records:
+- ns_per_lookup: best average wall time per query over --repeats runs
+- probes: average number of array elements read per query
+- cache_lines: average number of distinct 64-byte lines those reads touch,
+  assuming 8-byte slots (a proxy for cache misses on a real array)
+- jump_bytes: average distance in bytes between consecutive reads of one
+  query (large jumps defeat the hardware prefetcher)
+
+Probes are counted in a separate run that passes a sequence wrapper instead
+of the real list, so the timings are not affected. The wrapper has no C-level
+index(), so linear_search is counted on its plain loop.
+
+Usage:
+    python search_benchmark.py --sizes 1000 100000 --output run.json
+    python search_benchmark.py --output new.json --compare run.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+import binary_search
+import linear_search
+
+CACHE_LINE = 64  # bytes per cache line
+SLOT_SIZE = 8    # bytes per array slot assumed for the cache proxies
+
+DEFAULT_SIZES = [100, 10_000, 1_000_000]
+DEFAULT_HIT_RATIOS = [0.0, 0.5, 1.0]
+DEFAULT_QUERIES = 1000
+LINEAR_LIMIT = 100_000    # linear search is skipped above this size
+DEFAULT_THRESHOLD = 1.10  # slowdown ratio reported as a regression
+
+
+# Key distributions: sorted arrays of even ints, so odd ints are misses
+def dist_uniform(n, rng):
+    return [2 * i for i in range(n)]
+
+def dist_random(n, rng):
+    return sorted(rng.sample(range(0, 8 * n + 2, 2), n))
+
+def dist_clustered(n, rng):
+    arr, value = [], 0
+    for _ in range(n):
+        value += 2 * int(rng.expovariate(0.05)) if rng.random() < 0.05 else 2
+        arr.append(value)
+    return arr
+
+def dist_duplicates(n, rng):
+    return sorted(2 * rng.randrange(max(1, n // 10)) for _ in range(n))
+
+DISTRIBUTIONS = {
+    "uniform": dist_uniform,
+    "random": dist_random,
+    "clustered": dist_clustered,
+    "duplicates": dist_duplicates,
+}
+
+
+def make_input(distribution, n, hit_ratio, queries, seed):
+    """Build the same (array, queries) for the same arguments on every run."""
+    rng = random.Random(f"{seed}-{distribution}-{n}-{hit_ratio}")
+    arr = DISTRIBUTIONS[distribution](n, rng)
+    targets = []
+    for _ in range(queries):
+        if arr and rng.random() < hit_ratio:
+            targets.append(rng.choice(arr))
+        else:
+            targets.append(2 * rng.randrange(-1, n + 1) + 1)
+    return arr, targets
+
+
+# Search runners: each takes (arr, targets) and returns a function running
+# all the queries, so setup such as building an index is not timed
+def runner_for(search):
+    return lambda arr, targets: lambda: [search(arr, t) for t in targets]
+
+def eytzinger_runner(arr, targets):
+    index = binary_search.EytzingerIndex(arr)
+    return lambda: [index.search(t) for t in targets]
+
+def search_many_runner(arr, targets):
+    return lambda: binary_search.search_many(arr, targets)
+
+ALGORITHMS = {
+    "linear_search": runner_for(linear_search.linear_search),
+    "binary_search_iterative": runner_for(binary_search.binary_search_iterative),
+    "binary_search_recursive": runner_for(binary_search.binary_search_recursive),
+    "lower_bound": runner_for(binary_search.lower_bound),
+    "exponential_search": runner_for(binary_search.exponential_search),
+    "interpolation_search": runner_for(binary_search.interpolation_search),
+    "eytzinger": eytzinger_runner,
+    "search_many": search_many_runner,
+}
+
+
+class ProbeCounter:
+    """Sequence wrapper that remembers every index read from it."""
+
+    def __init__(self, items):
+        self.items = items
+        self.reads = []
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, i):
+        value = self.items[i]
+        self.reads.append(i)
+        return value
+
+
+def count_probes(name, arr, targets):
+    """
+    Return average (probes, cache lines, jump bytes) per query.
+
+    search_many answers all the targets in one batch, as it is timed, so its
+    reads are counted over the whole batch and shared out per query; its
+    jump is the average over the batch's whole read sequence.
+    """
+    counter = ProbeCounter(arr)
+    q = max(1, len(targets))
+    if name == "search_many":
+        binary_search.search_many(counter, targets)
+        reads = counter.reads
+        return len(reads) / q, len({i * SLOT_SIZE // CACHE_LINE for i in reads}) / q, _jump(reads)
+    if name == "eytzinger":
+        # Build once and count reads of its layout instead of the array
+        index = binary_search.EytzingerIndex(arr)
+        counter.items = index.layout
+        index.layout = counter
+    probes = lines = jumps = 0
+    for target in targets:
+        counter.reads = []
+        if name == "eytzinger":
+            index.search(target)
+        else:
+            ALGORITHMS[name](counter, [target])()
+        reads = counter.reads
+        probes += len(reads)
+        lines += len({i * SLOT_SIZE // CACHE_LINE for i in reads})
+        jumps += _jump(reads)
+    return probes / q, lines / q, jumps / q
+
+
+def _jump(reads):
+    """Average distance in bytes between consecutive reads."""
+    return sum(abs(b - a) for a, b in zip(reads, reads[1:])) * SLOT_SIZE / max(1, len(reads) - 1)
+
+
+def run_benchmark(algorithms, distributions, sizes, hit_ratios, queries=DEFAULT_QUERIES,
+                  repeats=3, seed=0, count=True):
+    """
+    Benchmark every search on every distribution, size and hit ratio.
+
+    Returns:
+        List of result dicts
+    """
+    results = []
+    for n in sizes:
+        for distribution in distributions:
+            for hit_ratio in hit_ratios:
+                arr, targets = make_input(distribution, n, hit_ratio, queries, seed)
+                for name in algorithms:
+                    if name == "linear_search" and n > LINEAR_LIMIT:
+                        continue
+                    run = ALGORITHMS[name](arr, targets)
+                    best = float("inf")
+                    for _ in range(repeats):
+                        start = time.perf_counter()
+                        run()
+                        best = min(best, time.perf_counter() - start)
+                    result = {"algorithm": name, "distribution": distribution, "size": n,
+                              "hit_ratio": hit_ratio, "ns_per_lookup": best * 1e9 / len(targets),
+                              "probes": None, "cache_lines": None, "jump_bytes": None}
+                    if count:
+                        # Probe counting is slow, a sample of the queries is enough,
+                        # except for search_many whose algorithm depends on the batch size
+                        sample = targets if name == "search_many" else targets[:100]
+                        result["probes"], result["cache_lines"], result["jump_bytes"] = \
+                            count_probes(name, arr, sample)
+                    results.append(result)
+                    print(f"{name:>24} {distribution:>11} {n:>9} hit={hit_ratio:<4} "
+                          f"{result['ns_per_lookup']:10.1f} ns/lookup", file=sys.stderr)
+    return results
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Find cases that got slower than threshold times the baseline.
+
+    Returns:
+        List of (key, baseline ns, current ns) tuples
+    """
+    def index(results):
+        return {(r["algorithm"], r["distribution"], r["size"], r["hit_ratio"]): r for r in results}
+
+    old = index(baseline["results"])
+    regressions = []
+    for key, result in index(current["results"]).items():
+        before = old.get(key)
+        if before and result["ns_per_lookup"] > before["ns_per_lookup"] * threshold:
+            regressions.append((key, before["ns_per_lookup"], result["ns_per_lookup"]))
+    return regressions
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the search algorithms.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS))
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHMS, default=list(ALGORITHMS))
+    parser.add_argument("--hit-ratios", type=float, nargs="+", default=DEFAULT_HIT_RATIOS)
+    parser.add_argument("--queries", type=int, default=DEFAULT_QUERIES, help="queries per case")
+    parser.add_argument("--repeats", type=int, default=3, help="timed runs per case, the best is kept")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the arrays and queries")
+    parser.add_argument("--no-counts", action="store_true", help="skip probe counting")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown ratio reported as a regression (default: 1.10)")
+    args = parser.parse_args()
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "queries": args.queries,
+            "repeats": args.repeats,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": run_benchmark(args.algorithms, args.distributions, args.sizes, args.hit_ratios,
+                                 queries=args.queries, repeats=args.repeats, seed=args.seed,
+                                 count=not args.no_counts),
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, report, args.threshold)
+        for (algorithm, distribution, size, hit_ratio), before, after in regressions:
+            print(f"REGRESSION {algorithm} {distribution} n={size} hit={hit_ratio}: "
+                  f"{before:.1f} ns -> {after:.1f} ns ({after / before:.2f}x)")
+        if regressions:
+            sys.exit(1)
+        print("No regressions found.")
+
+
+if __name__ == "__main__":
+    main()
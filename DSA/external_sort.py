@@ -0,0 +1,153 @@
+"""
+External Merge Sort
+
+Sorts text files that are too large to fit in memory, one record per line.
+
+1. Read the input in chunks that fit in the memory budget.
+2. Sort each chunk in memory with sorting_algo.sort (stable, each key
+   computed once) and spill it to a temporary "run" file.
+3. Stream a heap-driven k-way merge of the runs into the output file. When
+   there are more runs than max_fan_in, the runs are merged in several
+   passes so the number of open files (and read buffers) stays bounded.
+
+Usage:
+    python external_sort.py input.txt output.txt --memory 64M --numeric
+"""
+
+import argparse
+import heapq
+import os
+import sys
+import tempfile
+
+from sorting_algo import sort
+
+DEFAULT_MEMORY = 64 * 1024 * 1024  # bytes of records held in memory at once
+DEFAULT_FAN_IN = 64                 # runs merged at the same time
+MIN_BUFFER = 64 * 1024              # smallest read/write buffer per file
+
+
+def external_sort(input_path, output_path, memory=DEFAULT_MEMORY, key=None,
+                  reverse=False, max_fan_in=DEFAULT_FAN_IN, tmp_dir=None):
+    """
+    Sort the lines of input_path into output_path using bounded memory.
+
+    Args:
+        input_path: File to sort, one record per line
+        output_path: File to write the sorted records to
+        memory: Approximate memory budget in bytes for the in-memory chunks
+        key: Function computing the sort key of a line (defaults to the line)
+        reverse: Sort in descending order
+        max_fan_in: Maximum number of runs merged in one pass
+        tmp_dir: Directory for the temporary run files
+
+    Returns:
+        Number of records written
+    """
+    if max_fan_in < 2:
+        raise ValueError("max_fan_in must be at least 2")
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as workdir:
+        runs, count = _write_sorted_runs(input_path, workdir, memory, key, reverse)
+
+        # Keep merging groups of runs until one pass can finish the job
+        level = 0
+        while len(runs) > max_fan_in:
+            merged = []
+            for start in range(0, len(runs), max_fan_in):
+                group = runs[start:start + max_fan_in]
+                path = os.path.join(workdir, f"merge-{level}-{start}.txt")
+                _merge_runs(group, path, memory, key, reverse)
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+            level += 1
+
+        _merge_runs(runs, output_path, memory, key, reverse)
+    return count
+
+
+def _write_sorted_runs(input_path, workdir, memory, key, reverse):
+    """Split the input into sorted run files. Returns (run paths, record count)."""
+    runs = []
+    count = 0
+    chunk = []
+    used = 0
+    with open(input_path, "r", buffering=MIN_BUFFER) as source:
+        for line in source:
+            if not line.endswith("\n"):
+                line += "\n"
+            chunk.append(line)
+            used += sys.getsizeof(line)
+            if used >= memory:
+                runs.append(_spill(chunk, workdir, len(runs), key, reverse))
+                count += len(chunk)
+                chunk = []
+                used = 0
+    if chunk or not runs:
+        runs.append(_spill(chunk, workdir, len(runs), key, reverse))
+        count += len(chunk)
+    return runs, count
+
+
+def _spill(chunk, workdir, index, key, reverse):
+    """Sort one chunk in memory and write it to a run file."""
+    # Keys are computed once per record and the sort is stable
+    sort(chunk, key=key, reverse=reverse)
+
+    path = os.path.join(workdir, f"run-{index}.txt")
+    with open(path, "w", buffering=MIN_BUFFER) as run:
+        run.writelines(chunk)
+    return path
+
+
+def _merge_runs(runs, output_path, memory, key, reverse):
+    """Stream a k-way merge of sorted run files into output_path."""
+    buffer_size = max(MIN_BUFFER, memory // (len(runs) + 1))
+    files = [open(run, "r", buffering=buffer_size) for run in runs]
+    try:
+        with open(output_path, "w", buffering=buffer_size) as out:
+            out.writelines(heapq.merge(*files, key=key, reverse=reverse))
+    finally:
+        for f in files:
+            f.close()
+
+
+def parse_size(text):
+    """Parse a size such as '512K', '64M' or '2G' into bytes."""
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+    text = text.strip().upper().rstrip("B")
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Sort a file larger than memory, one record per line.")
+    parser.add_argument("input", help="file to sort")
+    parser.add_argument("output", help="where to write the sorted file")
+    parser.add_argument("--memory", default="64M", help="memory budget, e.g. 512K, 64M, 2G (default: 64M)")
+    parser.add_argument("--numeric", action="store_true", help="compare records as numbers")
+    parser.add_argument("--field", type=int, help="sort by this 0-based field instead of the whole line")
+    parser.add_argument("--sep", default=None, help="field separator (default: whitespace)")
+    parser.add_argument("--reverse", action="store_true", help="sort in descending order")
+    parser.add_argument("--fan-in", type=int, default=DEFAULT_FAN_IN, help="runs merged per pass")
+    parser.add_argument("--tmp-dir", default=None, help="directory for temporary run files")
+    args = parser.parse_args()
+
+    convert = float if args.numeric else str
+    if args.field is not None:
+        key = lambda line: convert(line.split(args.sep)[args.field])
+    elif args.numeric:
+        key = float
+    else:
+        key = None
+
+    count = external_sort(args.input, args.output, parse_size(args.memory), key=key,
+                          reverse=args.reverse, max_fan_in=args.fan_in, tmp_dir=args.tmp_dir)
+    print(f"Sorted {count} records into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,12 @@ This file implements a min heap data structure with the following operations:
 - extract_min: Remove and return the minimum element
 - peek: Return the minimum element without removing it
 - heapify: Convert an array into a valid heap
+- push_many / pop_many: Add many elements / remove the k smallest
+- pushpop / replace: Push then pop, or pop then push, in one sift
+
+Sifting is iterative and moves a "hole" instead of swapping: the moving
+element is held aside, the elements it passes are shifted one level, and
+it is written once at its final position.
 """
 
 class MinHeap:
@@ -48,10 +54,16 @@ class MinHeap:
         Args:
             i: Index of the element to sift up
         """
-        parent_idx = self.parent(i)
-        if i > 0 and self.heap[i] < self.heap[parent_idx]:
-            self.swap(i, parent_idx)
-            self._sift_up(parent_idx)
+        heap = self.heap
+        item = heap[i]
+        while i > 0:
+            parent_idx = (i - 1) >> 1
+            parent = heap[parent_idx]
+            if not item < parent:
+                break
+            heap[i] = parent  # shift the parent down into the hole
+            i = parent_idx
+        heap[i] = item
     
     def extract_min(self):
         """
@@ -63,12 +75,13 @@ class MinHeap:
         if self.size <= 0:
             return None
         
-        min_val = self.heap[0]
-        
-        # Replace root with last element and then heapify
-        self.heap[0] = self.heap[self.size - 1]
+        # Move the last element into the root's place and sift it down
+        last = self.heap.pop()
         self.size -= 1
-        self.heap.pop()
+        if self.size == 0:
+            return last
+        min_val = self.heap[0]
+        self.heap[0] = last
         self._sift_down(0)
         
         return min_val
@@ -77,25 +90,34 @@ class MinHeap:
         """
         Move the element at index i down to its correct position.
         
+        The hole is first moved all the way down along the smaller children,
+        then the element is sifted up from there. An element taken from the
+        bottom of the heap usually belongs near the bottom again, so this
+        needs about one comparison per level instead of two.
+        
         Args:
             i: Index of the element to sift down
         """
-        smallest = i
-        left = self.left_child(i)
-        right = self.right_child(i)
-        
-        # Check if left child exists and is smaller than root
-        if left < self.size and self.heap[left] < self.heap[smallest]:
-            smallest = left
-        
-        # Check if right child exists and is smaller than current smallest
-        if right < self.size and self.heap[right] < self.heap[smallest]:
-            smallest = right
-        
-        # If smallest is not the root
-        if smallest != i:
-            self.swap(i, smallest)
-            self._sift_down(smallest)
+        heap, size = self.heap, self.size
+        start = i
+        item = heap[i]
+        child = 2 * i + 1
+        while child < size:
+            # Pick the smaller child and shift it up into the hole
+            right = child + 1
+            if right < size and not heap[child] < heap[right]:
+                child = right
+            heap[i] = heap[child]
+            i = child
+            child = 2 * i + 1
+        while i > start:
+            parent_idx = (i - 1) >> 1
+            parent = heap[parent_idx]
+            if not item < parent:
+                break
+            heap[i] = parent
+            i = parent_idx
+        heap[i] = item
     
     def peek(self):
         """
@@ -121,6 +143,80 @@ class MinHeap:
         # Start from the last non-leaf node and heapify each node
         for i in range(self.size // 2 - 1, -1, -1):
             self._sift_down(i)
+    
+    def push_many(self, items):
+        """
+        Insert many keys at once.
+        
+        When the new keys outnumber the ones already in the heap, they are
+        appended and the whole heap is rebuilt bottom-up in O(n + k);
+        otherwise each is sifted up in O(log n).
+        
+        Args:
+            items: Iterable of keys to insert
+        """
+        items = list(items)
+        if len(items) > self.size:
+            self.heap.extend(items)
+            self.size = len(self.heap)
+            for i in range(self.size // 2 - 1, -1, -1):
+                self._sift_down(i)
+        else:
+            for item in items:
+                self.heap.append(item)
+                self.size += 1
+                self._sift_up(self.size - 1)
+    
+    def pop_many(self, k):
+        """
+        Remove and return the k smallest keys, smallest first.
+        
+        Args:
+            k: Number of keys to remove (fewer are returned if the heap runs out)
+        
+        Returns:
+            List of at most k keys in ascending order
+        """
+        return [self.extract_min() for _ in range(min(k, self.size))]
+    
+    def pushpop(self, key):
+        """
+        Insert key, then remove and return the minimum.
+        
+        Faster than insert followed by extract_min: if key is not larger
+        than the root it is returned straight away, otherwise it takes the
+        root's place and is sifted down once.
+        
+        Args:
+            key: The key to insert
+        
+        Returns:
+            The minimum of the heap and key
+        """
+        if self.size and self.heap[0] < key:
+            key, self.heap[0] = self.heap[0], key
+            self._sift_down(0)
+        return key
+    
+    def replace(self, key):
+        """
+        Remove and return the minimum, then insert key, with one sift.
+        
+        Unlike pushpop, the returned element may be larger than key.
+        
+        Args:
+            key: The key to insert
+        
+        Returns:
+            The previous minimum, or None if the heap was empty
+        """
+        if self.size <= 0:
+            self.insert(key)
+            return None
+        min_val = self.heap[0]
+        self.heap[0] = key
+        self._sift_down(0)
+        return min_val
 
 # Test cases
 if __name__ == "__main__":
@@ -154,4 +250,13 @@ if __name__ == "__main__":
     print("\nExtracting minimum elements after heapify:")
     while min_heap.size > 0:
         print(min_heap.extract_min(), end=" ")
-    print()
\ No newline at end of file
+    print()
+    
+    # Test bulk operations
+    print("\nTesting bulk operations:")
+    min_heap = MinHeap()
+    min_heap.push_many([7, 10, 3, 15, 2, 12, 8])
+    print("pop_many(3):", min_heap.pop_many(3))
+    print("pushpop(1):", min_heap.pushpop(1))
+    print("replace(1):", min_heap.replace(1))
+    print("Remaining:", min_heap.pop_many(min_heap.size))
\ No newline at end of file
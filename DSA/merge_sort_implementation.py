@@ -1,5 +1,11 @@
-def merge_sort(arr):
-   
+from sorting_merge_sort import merge_sort_bottom_up
+
+
+def merge_sort(arr, bottom_up=False):
+    # bottom_up copies arr once and sorts the copy iteratively, without slicing
+    if bottom_up:
+        return merge_sort_bottom_up(list(arr))
+
     if len(arr) <= 1:
         return arr
 
@@ -35,3 +41,4 @@ arr = [38, 27, 43, 3, 9, 82, 10]
 print("Original array:", arr)
 sorted_arr = merge_sort(arr)
 print("Sorted array:", sorted_arr)
+print("Sorted array (bottom-up):", merge_sort(arr, bottom_up=True))
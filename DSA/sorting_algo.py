@@ -9,12 +9,130 @@ Available algorithms:
 - Insertion Sort
 - Selection Sort
 - Merge Sort
+- Merge Sort (bottom-up, from sorting_merge_sort.py)
 - Quick Sort
+- Heap Sort
+- Intro Sort (quicksort with a heapsort fallback)
+- Hybrid Sort (picks one of the above from the shape of the input)
+- NumPy Sort (vectorized sort for numeric data, if NumPy is installed)
+- Counting Sort (ints with a small range of values)
+- Radix Sort (LSD for ints, MSD for bytes/strings)
+
+When only part of the order is needed there are also partial_sort (smallest
+k items in order), nth_element (k-th smallest / median in linear expected
+time) and top_k (k largest items of a stream in O(k) memory).
+
+Every sort takes optional key= and reverse= arguments like list.sort. Keys
+are computed once per item, the result is stable (even for the algorithms
+that are not stable on their own), and key/reverse may be lists to sort by
+several keys in mixed directions.
+
+Any of them can be run through instrumented() to count comparisons, moves,
+recursion depth and list allocations, and to time each helper function.
 
 It shows both the unsorted and sorted lists at the end.
 """
 
+import dis
+import functools
+import sys
+import time
+from array import array
+
+from heap_implementation import MinHeap
+from sorting_merge_sort import merge_sort_bottom_up, numeric_typecode
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, numpy_sort falls back to pure Python
+    np = None
+
+SMALL_SORT_THRESHOLD = 16  # below this many items insertion sort wins
+MIN_RUN_LENGTH = 32        # average run length that makes run merging worth it
+NUMPY_THRESHOLD = 1000     # numeric lists at least this long go to NumPy
+RADIX_BITS = 8             # bits of the key handled per radix sort pass
+
+
+# Key functions
+def _keyed(returns_new=False):
+    # Decorator adding key= and reverse= to a comparison sort. Without them
+    # the sort is called as before; with them the sort runs on (key, index)
+    # pairs built by _sort_with_keys. Other keyword options go straight to
+    # the sort. Set returns_new for sorts that return a new list instead of
+    # sorting in place.
+    def decorate(func):
+        @functools.wraps(func)
+        def keyed_sort(arr, key=None, reverse=False, **options):
+            if key is None and not reverse:
+                return func(arr, **options)
+            order = functools.partial(_comparison_order, functools.partial(func, **options))
+            return _sort_with_keys(arr, key, reverse, order, returns_new)
+        # Every decorated sort shares this code object; instrumented() skips it
+        global _KEYED_SORT_CODE
+        _KEYED_SORT_CODE = keyed_sort.__code__
+        return keyed_sort
+    return decorate
+
+_KEYED_SORT_CODE = None  # code of the keyed_sort wrapper, set by _keyed
+
+
+def _sort_with_keys(arr, key, reverse, order, returns_new=False):
+    """
+    Sort arr by key using an ordering function.
+
+    Args:
+        arr: Items to sort
+        key: None, a function, or a list of functions (None means the item)
+        reverse: A bool, or a list with one bool per key function
+        order: Function taking a list of keys and returning the indices
+               that sort it, stably
+        returns_new: Return a new list instead of writing into arr
+
+    Returns:
+        arr sorted in place, or a new sorted list
+    """
+    funcs = list(key) if isinstance(key, (list, tuple)) else [key]
+    directions = list(reverse) if isinstance(reverse, (list, tuple)) else [reverse] * len(funcs)
+    if len(directions) != len(funcs):
+        raise ValueError("reverse needs one flag per key function")
+
+    if len(set(directions)) == 1:
+        passes = [(funcs, directions[0])]
+    else:
+        # Mixed directions: one stable pass per key, least significant first
+        passes = [([f], d) for f, d in reversed(list(zip(funcs, directions)))]
+
+    items = list(arr)
+    for pass_funcs, descending in passes:
+        # Each key function runs exactly once per item
+        if len(pass_funcs) == 1:
+            f = pass_funcs[0]
+            keys = list(map(f, items)) if f else items[:]
+        else:
+            keys = [tuple(f(x) if f else x for f in pass_funcs) for x in items]
+        # Stable descending order = reversed stable ascending order of the
+        # reversed input
+        if descending:
+            items.reverse()
+            keys.reverse()
+        items = [items[i] for i in order(keys)]
+        if descending:
+            items.reverse()
+
+    if returns_new:
+        return items
+    arr[:] = array(arr.typecode, items) if isinstance(arr, array) else items
+    return arr
+
+
+def _comparison_order(func, keys):
+    # Sort (key, index) pairs with a comparison sort. The index breaks ties,
+    # so the order is stable and the items themselves are never compared.
+    return [i for _, i in func([(k, i) for i, k in enumerate(keys)])]
+
+
 # Bubble Sort
+@_keyed()
 def bubble_sort(arr):
     # Keep looping through the list multiple times
     # and swap adjacent elements if they're in the wrong order
@@ -26,6 +144,7 @@ def bubble_sort(arr):
 
 
 # Insertion Sort
+@_keyed()
 def insertion_sort(arr):
     # We take one element at a time and insert it in its correct place
     for i in range(1, len(arr)):
@@ -40,6 +159,7 @@ def insertion_sort(arr):
 
 
 # Selection Sort
+@_keyed()
 def selection_sort(arr):
     # Move through the array and pick the smallest element each time
     for i in range(len(arr)):
@@ -53,7 +173,13 @@ def selection_sort(arr):
 
 
 # Merge Sort
-def merge_sort(arr):
+@_keyed(returns_new=True)
+def merge_sort(arr, bottom_up=False):
+    # bottom_up copies the list once and merges iteratively through one
+    # scratch buffer instead of slicing at every level
+    if bottom_up:
+        return merge_sort_bottom_up(list(arr))
+
     # If the list has one or zero elements, it's already sorted
     if len(arr) <= 1:
         return arr
@@ -86,6 +212,7 @@ def merge(left, right):
 
 
 # Quick Sort
+@_keyed()
 def quick_sort(arr):
     # This function uses the divide-and-conquer approach
     # to sort elements by choosing a pivot
@@ -110,6 +237,685 @@ def quick_sort(arr):
     return arr
 
 
+# Heap Sort
+@_keyed()
+def heap_sort(arr):
+    # Build a max heap, then keep moving the largest element to the end
+    _heap_sort_range(arr, 0, len(arr))
+    return arr
+
+
+def _heap_sort_range(arr, lo, hi):
+    n = hi - lo
+    for root in range(n // 2 - 1, -1, -1):
+        _sift_down_max(arr, lo, root, n)
+    for end in range(n - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        _sift_down_max(arr, lo, 0, end)
+
+
+def _sift_down_max(arr, lo, root, end):
+    # Sift arr[lo + root] down a max heap of `end` items stored from lo
+    item = arr[lo + root]
+    child = 2 * root + 1
+    while child < end:
+        if child + 1 < end and arr[lo + child] < arr[lo + child + 1]:
+            child += 1
+        if not item < arr[lo + child]:
+            break
+        arr[lo + root] = arr[lo + child]
+        root = child
+        child = 2 * root + 1
+    arr[lo + root] = item
+
+
+# Intro Sort
+@_keyed()
+def intro_sort(arr):
+    # Quicksort with a median-of-three pivot that switches to heapsort when
+    # the recursion gets too deep, so the worst case stays O(n log n)
+    _introsort_range(arr, 0, len(arr), 2 * len(arr).bit_length())
+    return arr
+
+
+def _introsort_range(arr, lo, hi, depth):
+    while hi - lo > SMALL_SORT_THRESHOLD:
+        if depth == 0:
+            _heap_sort_range(arr, lo, hi)
+            return
+        depth -= 1
+        p = _partition(arr, lo, hi)
+        # Recurse into the smaller side and loop on the larger one
+        if p - lo < hi - p:
+            _introsort_range(arr, lo, p, depth)
+            lo = p
+        else:
+            _introsort_range(arr, p, hi, depth)
+            hi = p
+    _insertion_sort_range(arr, lo, hi)
+
+
+def _partition(arr, lo, hi):
+    # Hoare partition of arr[lo:hi] around the median of three.
+    # Returns p such that arr[lo:p] <= pivot <= arr[p:hi], both non-empty.
+    last = hi - 1
+    mid = (lo + last) // 2
+    if arr[mid] < arr[lo]:
+        arr[lo], arr[mid] = arr[mid], arr[lo]
+    if arr[last] < arr[mid]:
+        arr[mid], arr[last] = arr[last], arr[mid]
+        if arr[mid] < arr[lo]:
+            arr[lo], arr[mid] = arr[mid], arr[lo]
+    pivot = arr[mid]
+    i = lo - 1
+    j = hi
+    while True:
+        i += 1
+        while arr[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < arr[j]:
+            j -= 1
+        if i >= j:
+            return j + 1
+        arr[i], arr[j] = arr[j], arr[i]
+
+
+def _insertion_sort_range(arr, lo, hi):
+    for i in range(lo + 1, hi):
+        key = arr[i]
+        j = i - 1
+        while j >= lo and key < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+
+# Hybrid Sort
+def sort(arr, key=None, reverse=False):
+    """
+    Sort a list in place, choosing the strategy from the shape of the input.
+
+    - Numeric lists of at least NUMPY_THRESHOLD items, array.array and
+      numpy.ndarray inputs are handed to numpy_sort when NumPy is installed.
+    - Small inputs are insertion sorted.
+    - Lists of ints use counting sort when the values span a range no
+      bigger than twice the length, and LSD radix sort when the number of
+      radix passes is small compared to log2(n).
+    - Inputs made of a few long ascending/descending runs are sorted by
+      merging those natural runs (O(n) on already sorted data).
+    - Everything else goes through intro sort, which never degrades to
+      O(n^2) like the plain quick_sort above.
+
+    With key/reverse the same choice is made on the computed keys.
+
+    Args:
+        arr: List (or array.array / numpy.ndarray) of elements to sort
+        key: Optional key function, or list of key functions
+        reverse: Sort descending (or a list of flags, one per key)
+
+    Returns:
+        The same list, sorted
+    """
+    if key is not None or reverse:
+        return _sort_with_keys(arr, key, reverse, _hybrid_order)
+
+    n = len(arr)
+    if not isinstance(arr, list):
+        return numpy_sort(arr)
+    if np is not None and n >= NUMPY_THRESHOLD and numeric_typecode(arr):
+        return numpy_sort(arr)
+    if n <= SMALL_SORT_THRESHOLD:
+        return insertion_sort(arr)
+
+    strategy = _int_strategy(arr)
+    if strategy == "counting":
+        return counting_sort(arr)
+    if strategy == "radix":
+        return radix_sort(arr)
+
+    runs = _find_runs(arr)
+    if len(runs) * MIN_RUN_LENGTH <= n:
+        _merge_natural_runs(arr, runs)
+    else:
+        intro_sort(arr)
+    return arr
+
+
+def _int_strategy(arr):
+    # Pick "counting" or "radix" for a list of ints, None otherwise
+    if not arr or not all(type(x) is int for x in arr):
+        return None
+    n = len(arr)
+    span = max(arr) - min(arr)
+    if span <= 2 * n:
+        return "counting"
+    passes = -(-span.bit_length() // RADIX_BITS)
+    if 3 * passes < n.bit_length():
+        return "radix"
+    return None
+
+
+def _hybrid_order(keys):
+    # Ordering function used by sort() when a key is given
+    strategy = _int_strategy(keys)
+    if strategy == "counting":
+        return _counting_order(keys)
+    if strategy == "radix":
+        return _radix_order(keys)
+    decorated = [(k, i) for i, k in enumerate(keys)]
+    sort(decorated)
+    return [i for _, i in decorated]
+
+
+def _find_runs(arr):
+    # Split arr into maximal non-descending runs, reversing strictly
+    # descending runs in place (strictness keeps equal items in order).
+    # Returns the list of run start indices followed by len(arr).
+    n = len(arr)
+    bounds = [0]
+    i = 0
+    while i < n - 1:
+        j = i + 1
+        if arr[j] < arr[i]:
+            while j + 1 < n and arr[j + 1] < arr[j]:
+                j += 1
+            arr[i:j + 1] = arr[i:j + 1][::-1]
+        else:
+            while j + 1 < n and not arr[j + 1] < arr[j]:
+                j += 1
+        i = j + 1
+        bounds.append(i)
+    if bounds[-1] != n:
+        bounds.append(n)
+    return bounds
+
+
+def _merge_natural_runs(arr, bounds):
+    # Merge neighbouring runs pairwise until a single run is left
+    while len(bounds) > 2:
+        merged = [0]
+        for k in range(0, len(bounds) - 2, 2):
+            lo, mid = bounds[k], bounds[k + 1]
+            hi = bounds[k + 2]
+            _merge_in_place(arr, lo, mid, hi)
+            merged.append(hi)
+        if merged[-1] != bounds[-1]:
+            merged.append(bounds[-1])
+        bounds = merged
+
+
+def _merge_in_place(arr, lo, mid, hi):
+    # Stable merge of the sorted slices arr[lo:mid] and arr[mid:hi]
+    if mid >= hi or not arr[mid] < arr[mid - 1]:
+        return
+    left = arr[lo:mid]
+    i, j, k = 0, mid, lo
+    while i < len(left) and j < hi:
+        if arr[j] < left[i]:
+            arr[k] = arr[j]
+            j += 1
+        else:
+            arr[k] = left[i]
+            i += 1
+        k += 1
+    arr[k:k + len(left) - i] = left[i:]
+
+
+# Counting Sort
+def counting_sort(arr, key=None, reverse=False):
+    # Count how many times each value occurs, then write the values back
+    # in order. Works for ints (negatives too) in O(n + max - min).
+    if key is not None or reverse:
+        return _sort_with_keys(arr, key, reverse, _counting_order)
+    if len(arr) <= 1:
+        return arr
+    low = min(arr)
+    counts = [0] * (max(arr) - low + 1)
+    for x in arr:
+        counts[x - low] += 1
+    i = 0
+    for offset, count in enumerate(counts):
+        if count:
+            arr[i:i + count] = [low + offset] * count
+            i += count
+    return arr
+
+
+def _counting_order(keys):
+    # Stable counting sort of the indices of keys: count each key, turn the
+    # counts into start positions, then place the indices in input order
+    if not keys:
+        return []
+    low = min(keys)
+    starts = [0] * (max(keys) - low + 2)
+    for k in keys:
+        starts[k - low + 1] += 1
+    for v in range(1, len(starts)):
+        starts[v] += starts[v - 1]
+    order = [0] * len(keys)
+    for i, k in enumerate(keys):
+        order[starts[k - low]] = i
+        starts[k - low] += 1
+    return order
+
+
+# Radix Sort
+def radix_sort(arr, key=None, reverse=False):
+    # LSD radix sort for ints: distribute the items into buckets by one byte
+    # of (x - min) at a time, least significant byte first. Each pass keeps
+    # the order of the previous one, so after the last pass the list is
+    # sorted. O(n * w) where w is the number of bytes in max - min.
+    if key is not None or reverse:
+        return _sort_with_keys(arr, key, reverse, _radix_order)
+    if len(arr) <= 1:
+        return arr
+    low = min(arr)
+    span = max(arr) - low
+    mask = (1 << RADIX_BITS) - 1
+    shift = 0
+    while span >> shift:
+        buckets = [[] for _ in range(mask + 1)]
+        for x in arr:
+            buckets[((x - low) >> shift) & mask].append(x)
+        arr[:] = [x for bucket in buckets for x in bucket]
+        shift += RADIX_BITS
+    return arr
+
+
+def _radix_order(keys):
+    # LSD radix sort of the indices of keys, same passes as radix_sort
+    order = list(range(len(keys)))
+    if len(keys) <= 1:
+        return order
+    low = min(keys)
+    span = max(keys) - low
+    mask = (1 << RADIX_BITS) - 1
+    shift = 0
+    while span >> shift:
+        buckets = [[] for _ in range(mask + 1)]
+        for i in order:
+            buckets[((keys[i] - low) >> shift) & mask].append(i)
+        order = [i for bucket in buckets for i in bucket]
+        shift += RADIX_BITS
+    return order
+
+
+def msd_radix_sort(arr, key=None, reverse=False):
+    # MSD radix sort for bytes or str keys: group the items by their first
+    # character, then sort each group by the next character, and so on.
+    # Shorter keys come before longer keys sharing the same prefix.
+    return _sort_with_keys(arr, key, reverse, _msd_order)
+
+
+def _msd_order(keys):
+    order = list(range(len(keys)))
+    _msd_radix_sort_range(order, keys, 0, len(order), 0)
+    return order
+
+
+def _msd_radix_sort_range(order, keys, lo, hi, depth):
+    # Sort order[lo:hi] by key. Every key in the range shares the same
+    # first `depth` characters.
+    if hi - lo <= SMALL_SORT_THRESHOLD:
+        for a in range(lo + 1, hi):
+            i = order[a]
+            b = a - 1
+            while b >= lo and keys[i] < keys[order[b]]:
+                order[b + 1] = order[b]
+                b -= 1
+            order[b + 1] = i
+        return
+    finished = []
+    buckets = {}
+    for i in order[lo:hi]:
+        key = keys[i]
+        if len(key) <= depth:
+            finished.append(i)
+        else:
+            buckets.setdefault(key[depth], []).append(i)
+    pos = lo + len(finished)
+    order[lo:pos] = finished
+    for char in sorted(buckets):
+        bucket = buckets[char]
+        order[pos:pos + len(bucket)] = bucket
+        _msd_radix_sort_range(order, keys, pos, pos + len(bucket), depth + 1)
+        pos += len(bucket)
+
+
+# NumPy Sort
+def numpy_sort(arr, stable=False, argsort=False, key=None, reverse=False):
+    """
+    Sort numeric data with NumPy's vectorized sort.
+
+    Accepts a list of ints/floats, an array.array or a numpy.ndarray and
+    gives back the same type. Without NumPy the pure Python sorts are used.
+
+    Args:
+        arr: Numeric data to sort
+        stable: Use a stable sort (only matters for argsort)
+        argsort: Return the indices that would sort arr instead of sorting it
+        key: Optional key function (or list of them); the keys are computed
+             in Python once and then argsorted by NumPy, so arr may hold
+             any kind of items in that case
+        reverse: Sort descending (or a list of flags, one per key)
+
+    Returns:
+        arr sorted in place, or with argsort=True a new container of the
+        same type holding the sorting indices
+    """
+    if key is not None or reverse:
+        return _sort_with_keys(arr, key, reverse, _numpy_order)
+
+    kind = "stable" if stable else "quicksort"
+    if argsort:
+        if np is not None:
+            order = np.argsort(np.asarray(arr), kind=kind)
+        else:
+            order = sorted(range(len(arr)), key=arr.__getitem__)
+        if isinstance(arr, list):
+            return order if np is None else order.tolist()
+        if isinstance(arr, array):
+            return array('q', order)
+        return order
+
+    if np is not None and isinstance(arr, np.ndarray):
+        arr.sort(kind=kind)
+    elif np is not None and isinstance(arr, array):
+        # Sort the array.array's own buffer through a zero-copy view
+        np.frombuffer(arr, dtype=arr.typecode).sort(kind=kind)
+    elif np is not None:
+        typecode = numeric_typecode(arr)
+        if typecode is None:
+            raise TypeError("numpy_sort needs all-int or all-float input")
+        data = np.array(arr, dtype=typecode)
+        data.sort(kind=kind)
+        arr[:] = data.tolist()
+    elif isinstance(arr, array):
+        arr[:] = array(arr.typecode, merge_sort_bottom_up(arr.tolist()))
+    else:
+        merge_sort_bottom_up(arr)
+    return arr
+
+
+def _numpy_order(keys):
+    # Stable argsort of the keys, vectorized when they are plain numbers
+    if np is not None and numeric_typecode(keys):
+        return np.argsort(np.array(keys), kind="stable").tolist()
+    return _comparison_order(merge_sort_bottom_up, keys)
+
+
+# Partial Sorting
+def nth_element(arr, k):
+    """
+    Rearrange arr so that arr[k] is the item a full sort would put there.
+
+    Everything before index k ends up <= arr[k] and everything after it
+    >= arr[k], in no particular order. Uses introselect: quickselect with
+    the median-of-three partition from intro sort, switching to heap sort
+    on the remaining range if the partitions keep coming out lopsided.
+
+    Args:
+        arr: List of elements
+        k: Index of the wanted item (len(arr) // 2 gives the median)
+
+    Returns:
+        The k-th smallest item
+
+    Time Complexity: O(n) expected, O(n log n) worst case
+    """
+    if not 0 <= k < len(arr):
+        raise IndexError("k out of range")
+    lo, hi = 0, len(arr)
+    depth = 2 * len(arr).bit_length()
+    while hi - lo > SMALL_SORT_THRESHOLD:
+        if depth == 0:
+            _heap_sort_range(arr, lo, hi)
+            return arr[k]
+        depth -= 1
+        p = _partition(arr, lo, hi)
+        # Only the side holding index k needs further work
+        if k < p:
+            hi = p
+        else:
+            lo = p
+    _insertion_sort_range(arr, lo, hi)
+    return arr[k]
+
+
+def partial_sort(arr, k):
+    """
+    Put the k smallest items of arr, in order, at the front of arr.
+
+    Args:
+        arr: List of elements
+        k: Number of items to sort
+
+    Returns:
+        The same list; arr[:k] is sorted, the rest is in no particular order
+
+    Time Complexity: O(n + k log k) expected
+    """
+    k = min(k, len(arr))
+    if k <= 0:
+        return arr
+    if k < len(arr):
+        nth_element(arr, k - 1)
+    _introsort_range(arr, 0, k, 2 * k.bit_length())
+    return arr
+
+
+def top_k(iterable, k, key=None):
+    """
+    Return the k largest items of an iterable, largest first.
+
+    The items are consumed one at a time while a MinHeap holds the k best
+    seen so far; its root is the smallest of them, so each new item needs
+    one comparison to be rejected. Memory stays O(k) however long the
+    stream is. Among equal keys the earliest items win.
+
+    Args:
+        iterable: Any iterable, e.g. a generator reading a huge file
+        k: Number of items to keep
+        key: Optional key function, computed once per item
+
+    Returns:
+        List of at most k items, sorted from largest to smallest
+
+    Time Complexity: O(n log k)
+    """
+    if k <= 0:
+        return []
+    heap = MinHeap()
+    for seq, item in enumerate(iterable):
+        # -seq makes later items "smaller", so they lose ties
+        entry = (item if key is None else key(item), -seq, item)
+        if heap.size < k:
+            heap.insert(entry)
+        elif heap.peek() < entry:
+            heap.replace(entry)
+    entries = heap.pop_many(heap.size)
+    entries.reverse()
+    return [item for _, _, item in entries]
+
+
+# Instrumentation
+class SortStats:
+    """Counters collected by instrumented() for one sort call."""
+
+    def __init__(self):
+        self.comparisons = 0     # <, <=, >, >= between items
+        self.moves = 0           # items written into the input list
+        self.max_depth = 0       # deepest nesting of sort function calls
+        self.allocations = 0     # lists built by the sort code (literals, slices, comprehensions)
+        self.phase_seconds = {}  # inclusive time of each sort function, outermost calls only
+        self.phase_calls = {}    # number of calls to each sort function
+
+    def as_dict(self):
+        return dict(vars(self))
+
+
+class _CountedItem:
+    # Wraps an item and counts every ordering comparison made on it
+    __slots__ = ("value", "stats")
+
+    def __init__(self, value, stats):
+        self.value = value
+        self.stats = stats
+
+    def __lt__(self, other):
+        self.stats.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        self.stats.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        self.stats.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        self.stats.comparisons += 1
+        return self.value >= other.value
+
+
+class _CountedList(list):
+    # List that counts how many items are written into it
+    def __init__(self, items, stats):
+        super().__init__(items)
+        self.stats = stats
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self.stats.moves += len(value)
+        else:
+            self.stats.moves += 1
+        super().__setitem__(index, value)
+
+
+class _Tracer:
+    # sys.settrace hook that follows only frames running code from this
+    # module and sorting_merge_sort.py. It tracks call depth, time per
+    # function, and counts the opcodes that build a new list. A recursive
+    # function is timed from its outermost call only, so nested frames are
+    # not counted twice.
+    FILES = {heap_sort.__code__.co_filename, merge_sort_bottom_up.__code__.co_filename}
+
+    def __init__(self, stats):
+        self.stats = stats
+        self.depth = 0
+        self.starts = []
+        self.active = {}  # code object -> frames of it currently running
+        self.alloc_offsets = {}
+
+    def on_call(self, frame, event, arg):
+        code = frame.f_code
+        if event != "call" or code.co_filename not in self.FILES or code in _UNTRACED_CODE:
+            return None
+        self.depth += 1
+        self.stats.max_depth = max(self.stats.max_depth, self.depth)
+        self.starts.append(time.perf_counter())
+        self.active[code] = self.active.get(code, 0) + 1
+        frame.f_trace_lines = False
+        frame.f_trace_opcodes = True
+        return self.on_event
+
+    def on_event(self, frame, event, arg):
+        if event == "opcode":
+            if frame.f_lasti in self._alloc_offsets(frame.f_code):
+                self.stats.allocations += 1
+        elif event == "return":
+            code = frame.f_code
+            name = code.co_name
+            elapsed = time.perf_counter() - self.starts.pop()
+            self.active[code] -= 1
+            if not self.active[code]:
+                self.stats.phase_seconds[name] = self.stats.phase_seconds.get(name, 0.0) + elapsed
+            self.stats.phase_calls[name] = self.stats.phase_calls.get(name, 0) + 1
+            self.depth -= 1
+        return self.on_event
+
+    def _alloc_offsets(self, code):
+        offsets = self.alloc_offsets.get(code)
+        if offsets is None:
+            ops = [(i.offset, i.opname) for i in dis.get_instructions(code)]
+            offsets = set()
+            for k, (offset, name) in enumerate(ops):
+                next_name = ops[k + 1][1] if k + 1 < len(ops) else None
+                if name in ("BUILD_LIST", "BINARY_SLICE") or (
+                        name == "BUILD_SLICE" and next_name == "BINARY_SUBSCR"):
+                    offsets.add(offset)
+            self.alloc_offsets[code] = offsets
+        return offsets
+
+
+# The counting wrappers and the keyed_sort wrapper added by _keyed live in
+# this file but are not part of any sort
+_UNTRACED_CODE = {
+    method.__code__
+    for method in (_CountedItem.__lt__, _CountedItem.__le__, _CountedItem.__gt__,
+                   _CountedItem.__ge__, _CountedList.__setitem__)
+} | {_KEYED_SORT_CODE}
+NON_COMPARISON_SORTS = {"counting_sort", "radix_sort", "msd_radix_sort", "numpy_sort"}
+
+
+def instrumented(func, arr, sink=None, trace=True):
+    """
+    Run one of the sort functions with instrumentation switched on.
+
+    The sort functions themselves are untouched, so there is no overhead
+    when they are called normally:
+    - comparisons are counted by wrapping every item (skipped for the
+      counting/radix/NumPy sorts, which need the raw values; wrapped items
+      also steer sort() away from its int-only paths)
+    - moves are counted by passing a list subclass that sees every write
+    - with trace=True a sys.settrace hook records the recursion depth, the
+      lists allocated by the sort code and the time spent in each function
+
+    Args:
+        func: Sort function to run, e.g. quick_sort
+        arr: List to sort (sorted in place like a normal call)
+        sink: Optional callable(phase, seconds) that receives the time of
+              every traced function plus a final "total" entry
+        trace: Also collect depth, allocations and per-phase timings
+               (much slower, since every opcode of the sort is traced)
+
+    Returns:
+        (sorted list, SortStats)
+    """
+    stats = SortStats()
+    wrap = func.__name__ not in NON_COMPARISON_SORTS
+    counted = _CountedList((_CountedItem(x, stats) for x in arr) if wrap else arr, stats)
+    stats.moves = 0
+
+    tracer = _Tracer(stats) if trace else None
+    previous = sys.gettrace()
+    start = time.perf_counter()
+    if tracer:
+        sys.settrace(tracer.on_call)
+    try:
+        result = func(counted)
+    finally:
+        if tracer:
+            sys.settrace(previous)
+    total = time.perf_counter() - start
+
+    values = [x.value for x in result] if wrap else list(result)
+    if result is counted:
+        arr[:] = values
+        result = arr
+    else:
+        result = values
+
+    if sink is not None:
+        for phase, seconds in stats.phase_seconds.items():
+            sink(phase, seconds)
+        sink("total", total)
+    return result, stats
+
+
 # Main Program
 if __name__ == "__main__":
     print(" Welcome to Sorting Algorithms Demo!")
@@ -122,8 +928,16 @@ if __name__ == "__main__":
     print("3. Selection Sort")
     print("4. Merge Sort")
     print("5. Quick Sort")
+    print("6. Heap Sort")
+    print("7. Intro Sort")
+    print("8. Hybrid Sort (auto)")
+    print("9. Merge Sort (bottom-up)")
+    print("10. NumPy Sort")
+    print("11. Counting Sort")
+    print("12. Radix Sort")
+    print("13. Partial Sort (smallest k only)")
 
-    choice = input("Enter your choice (1-5): ").strip()
+    choice = input("Enter your choice (1-13): ").strip()
     print(f"\nUnsorted List: {arr}")
 
     # Run the chosen sorting algorithm
@@ -142,6 +956,31 @@ if __name__ == "__main__":
     elif choice == '5':
         sorted_arr = quick_sort(arr.copy())
         algo = "Quick Sort"
+    elif choice == '6':
+        sorted_arr = heap_sort(arr.copy())
+        algo = "Heap Sort"
+    elif choice == '7':
+        sorted_arr = intro_sort(arr.copy())
+        algo = "Intro Sort"
+    elif choice == '8':
+        sorted_arr = sort(arr.copy())
+        algo = "Hybrid Sort"
+    elif choice == '9':
+        sorted_arr = merge_sort(arr, bottom_up=True)
+        algo = "Bottom-up Merge Sort"
+    elif choice == '10':
+        sorted_arr = numpy_sort(arr.copy())
+        algo = "NumPy Sort" if np is not None else "Bottom-up Merge Sort (NumPy not installed)"
+    elif choice == '11':
+        sorted_arr = counting_sort(arr.copy())
+        algo = "Counting Sort"
+    elif choice == '12':
+        sorted_arr = radix_sort(arr.copy())
+        algo = "Radix Sort"
+    elif choice == '13':
+        k = int(input("How many of the smallest numbers do you want? ").strip())
+        sorted_arr = partial_sort(arr.copy(), k)[:k]
+        algo = f"Partial Sort (k={k})"
     else:
         print("Invalid choice! Using Quick Sort by default.")
         sorted_arr = quick_sort(arr.copy())
@@ -0,0 +1,276 @@
+"""
+Sorting Benchmark
+
+Times every sort function in sorting_algo.py and sorting_merge_sort.py on a
+set of reproducible input distributions and writes the results as JSON, so
+two runs can be compared to catch performance regressions.
+
+For each (algorithm, distribution, size) it records:
+- seconds: best wall time over --repeats runs
+- comparisons: number of <, <=, >, >= calls between items
+- moves: number of items written into the input list
+- allocations: lists built by the sort code
+- max_depth: deepest nesting of sort function calls
+- peak_bytes: peak memory allocated while sorting (tracemalloc)
+
+The counters come from sorting_algo.instrumented() in a separate run, so the
+timings are not affected by the counting. Because the wrapped items are no
+longer plain ints, type-specialised paths (radix, counting, NumPy) are
+bypassed in that run, algorithms that never compare items report null
+comparisons, and parallel_merge_sort is not instrumented at all.
+Allocations and depth need opcode tracing, which is very slow, so they are
+only collected with --trace, up to TRACE_LIMIT items (QUADRATIC_TRACE_LIMIT
+for the O(n^2) sorts).
+
+Usage:
+    python sorting_benchmark.py --sizes 10 1000 100000 --output run.json
+    python sorting_benchmark.py --output new.json --compare run.json
+    python sorting_benchmark.py --sizes 100 1000 --trace
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import sorting_algo
+import sorting_merge_sort
+
+ALGORITHMS = {
+    "bubble_sort": sorting_algo.bubble_sort,
+    "insertion_sort": sorting_algo.insertion_sort,
+    "selection_sort": sorting_algo.selection_sort,
+    "merge_sort": sorting_algo.merge_sort,
+    "quick_sort": sorting_algo.quick_sort,
+    "heap_sort": sorting_algo.heap_sort,
+    "intro_sort": sorting_algo.intro_sort,
+    "sort": sorting_algo.sort,
+    "counting_sort": sorting_algo.counting_sort,
+    "radix_sort": sorting_algo.radix_sort,
+    "numpy_sort": sorting_algo.numpy_sort,
+    "merge_sort_top_down": sorting_merge_sort.merge_sort,
+    "merge_sort_bottom_up": sorting_merge_sort.merge_sort_bottom_up,
+    "parallel_merge_sort": sorting_merge_sort.parallel_merge_sort,
+}
+
+QUADRATIC = {"bubble_sort", "insertion_sort", "selection_sort"}
+NOT_INSTRUMENTED = {"parallel_merge_sort"}  # the real work happens in other processes
+
+DEFAULT_SIZES = [10, 100, 1000, 10_000, 100_000]
+QUADRATIC_LIMIT = 5000   # O(n^2) sorts are skipped above this size
+COUNTING_RANGE_LIMIT = 10_000_000  # counting sort is skipped above this value range
+COUNT_LIMIT = 100_000    # counting and memory runs are skipped above this size
+TRACE_LIMIT = 10_000     # allocation/depth tracing is skipped above this size
+QUADRATIC_TRACE_LIMIT = 500  # ... and above this size for the O(n^2) sorts
+DEFAULT_THRESHOLD = 1.10  # slowdown ratio reported as a regression
+
+
+# Input distributions
+def dist_random(n, rng):
+    return [rng.randrange(2 ** 31) for _ in range(n)]
+
+def dist_sorted(n, rng):
+    return list(range(n))
+
+def dist_reverse(n, rng):
+    return list(range(n, 0, -1))
+
+def dist_few_unique(n, rng):
+    return [rng.randrange(10) for _ in range(n)]
+
+def dist_organ_pipe(n, rng):
+    half = n // 2
+    return list(range(half)) + list(range(n - half, 0, -1))
+
+def dist_sawtooth(n, rng):
+    period = max(1, n // 10)
+    return [i % period for i in range(n)]
+
+def dist_sorted_k_swaps(n, rng):
+    arr = list(range(n))
+    for _ in range(max(1, n // 100) if n > 1 else 0):
+        i, j = rng.randrange(n), rng.randrange(n)
+        arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+DISTRIBUTIONS = {
+    "random": dist_random,
+    "sorted": dist_sorted,
+    "reverse": dist_reverse,
+    "few_unique": dist_few_unique,
+    "organ_pipe": dist_organ_pipe,
+    "sawtooth": dist_sawtooth,
+    "sorted_k_swaps": dist_sorted_k_swaps,
+}
+
+
+def make_input(distribution, n, seed):
+    """Build the same input for the same (distribution, n, seed) on every run."""
+    rng = random.Random(f"{seed}-{distribution}-{n}")
+    return DISTRIBUTIONS[distribution](n, rng)
+
+
+def time_sort(func, data, repeats):
+    """Return the best time of `repeats` runs of func on copies of data."""
+    best = float("inf")
+    for _ in range(repeats):
+        arr = data.copy()
+        start = time.perf_counter()
+        func(arr)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def count_operations(func, data, trace):
+    """Return the SortStats of func sorting a copy of data."""
+    _, stats = sorting_algo.instrumented(func, data.copy(), trace=trace)
+    return stats
+
+
+def measure_peak_memory(func, data):
+    """Return the peak number of bytes allocated while func sorts data."""
+    arr = data.copy()
+    tracemalloc.start()
+    try:
+        func(arr)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_benchmark(algorithms, distributions, sizes, repeats=3, seed=0,
+                  count=True, quadratic_limit=QUADRATIC_LIMIT, trace=False):
+    """
+    Benchmark every algorithm on every distribution and size.
+
+    With trace=True the counting run also traces allocations and depth.
+
+    Returns:
+        List of result dicts, one per (algorithm, distribution, size)
+    """
+    results = []
+    for n in sizes:
+        for distribution in distributions:
+            data = make_input(distribution, n, seed)
+            expected = sorted(data)
+            span = expected[-1] - expected[0] if data else 0
+            for name in algorithms:
+                if name in QUADRATIC and n > quadratic_limit:
+                    continue
+                if name == "counting_sort" and span > COUNTING_RANGE_LIMIT:
+                    continue
+                func = ALGORITHMS[name]
+                result = {"algorithm": name, "distribution": distribution, "size": n,
+                          "seconds": None, "comparisons": None, "moves": None,
+                          "allocations": None, "max_depth": None,
+                          "peak_bytes": None, "error": None}
+                try:
+                    output = func(data.copy())
+                    if list(output) != expected:
+                        raise AssertionError("output is not sorted")
+                    result["seconds"] = time_sort(func, data, repeats)
+                    if count and n <= COUNT_LIMIT:
+                        result["peak_bytes"] = measure_peak_memory(func, data)
+                        if name not in NOT_INSTRUMENTED:
+                            limit = QUADRATIC_TRACE_LIMIT if name in QUADRATIC else TRACE_LIMIT
+                            traced = trace and n <= limit
+                            stats = count_operations(func, data, traced)
+                            if name not in sorting_algo.NON_COMPARISON_SORTS:
+                                result["comparisons"] = stats.comparisons
+                            result["moves"] = stats.moves
+                            if traced:
+                                result["allocations"] = stats.allocations
+                                result["max_depth"] = stats.max_depth
+                except (RecursionError, AssertionError) as error:
+                    result["error"] = f"{type(error).__name__}: {error}"
+                results.append(result)
+                print(_format_result(result), file=sys.stderr)
+    return results
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """
+    Find runs that got slower than threshold times the baseline.
+
+    Returns:
+        List of (key, baseline seconds, current seconds) tuples
+    """
+    def index(results):
+        return {(r["algorithm"], r["distribution"], r["size"]): r for r in results}
+
+    old = index(baseline["results"])
+    regressions = []
+    for key, result in index(current["results"]).items():
+        before = old.get(key)
+        if not before or before["seconds"] is None or result["seconds"] is None:
+            continue
+        if result["seconds"] > before["seconds"] * threshold:
+            regressions.append((key, before["seconds"], result["seconds"]))
+    return regressions
+
+
+def _format_result(result):
+    label = f"{result['algorithm']:>22} {result['distribution']:>15} {result['size']:>9}"
+    if result["error"]:
+        return f"{label}  {result['error']}"
+    return f"{label}  {result['seconds'] * 1000:10.3f} ms"
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the sorting algorithms.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS))
+    parser.add_argument("--algorithms", nargs="+", choices=ALGORITHMS, default=list(ALGORITHMS))
+    parser.add_argument("--repeats", type=int, default=3, help="timed runs per case, the best is kept")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the input distributions")
+    parser.add_argument("--quadratic-limit", type=int, default=QUADRATIC_LIMIT,
+                        help="largest size run through the O(n^2) sorts")
+    parser.add_argument("--no-counts", action="store_true",
+                        help="skip comparison/move/allocation/memory counting")
+    parser.add_argument("--trace", action="store_true",
+                        help="also record allocations and call depth (slow opcode tracing)")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="slowdown ratio reported as a regression (default: 1.10)")
+    args = parser.parse_args()
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeats": args.repeats,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": run_benchmark(args.algorithms, args.distributions, args.sizes,
+                                 repeats=args.repeats, seed=args.seed,
+                                 count=not args.no_counts,
+                                 quadratic_limit=args.quadratic_limit,
+                                 trace=args.trace),
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, report, args.threshold)
+        for (algorithm, distribution, size), before, after in regressions:
+            print(f"REGRESSION {algorithm} {distribution} n={size}: "
+                  f"{before * 1000:.3f} ms -> {after * 1000:.3f} ms ({after / before:.2f}x)")
+        if regressions:
+            sys.exit(1)
+        print("No regressions found.")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,18 +3,40 @@ Merge Sort Algorithm
 
 Implementation of the Merge Sort algorithm, which uses a divide and conquer approach.
 Time complexity: O(n log n)
+
+merge_sort is the classic top-down version and returns a new list;
+merge_sort(arr, bottom_up=True) returns a new list too, but builds it with
+merge_sort_bottom_up, an iterative version that sorts a list in place using
+a single scratch buffer instead of slicing the list at every level.
+parallel_merge_sort spreads large numeric arrays over several processes and
+merges the sorted chunks at the end.
 """
 
-def merge_sort(arr):
+import heapq
+import os
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+RUN_LENGTH = 32  # size of the blocks insertion sorted before merging
+MIN_GALLOP = 7   # wins in a row before a merge switches to galloping
+PARALLEL_THRESHOLD = 100_000  # smaller inputs are not worth the process startup
+
+def merge_sort(arr, bottom_up=False):
     """
     Sort an array using the Merge Sort algorithm.
     
     Args:
         arr: List of elements to sort
+        bottom_up: Copy arr once and sort the copy with merge_sort_bottom_up
+                   instead of slicing at every level
         
     Returns:
         Sorted list
     """
+    if bottom_up:
+        return merge_sort_bottom_up(list(arr))
     if len(arr) <= 1:
         return arr
     
@@ -59,6 +81,187 @@ def merge(left, right):
     
     return result
 
+def merge_sort_bottom_up(arr):
+    """
+    Sort an array in place using an iterative bottom-up merge sort.
+    
+    Unlike merge_sort, this changes arr itself; merge_sort(arr,
+    bottom_up=True) is the version that leaves its input alone.
+    
+    Blocks of RUN_LENGTH items are insertion sorted first, then merged in
+    passes of doubling width. Each pass merges from the list into one
+    preallocated scratch buffer (or back) one index at a time, so apart from
+    that buffer no lists are created and there is no recursion. Merges
+    gallop: instead of comparing before every move, they binary search how
+    far the current side keeps winning and copy that whole stretch without
+    further comparisons, which makes merging nearly sorted data close to
+    linear. Galloping only kicks in after one side has won MIN_GALLOP times
+    in a row, so random data pays nothing.
+    
+    Args:
+        arr: List of elements to sort
+        
+    Returns:
+        The same list, sorted (the sort is stable)
+    """
+    n = len(arr)
+    if n <= 1:
+        return arr
+    
+    for lo in range(0, n, RUN_LENGTH):
+        _insertion_sort_range(arr, lo, min(lo + RUN_LENGTH, n))
+    
+    src, dst = arr, [None] * n
+    width = RUN_LENGTH
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            gallop_merge(src, dst, lo, mid, hi)
+        src, dst = dst, src
+        width *= 2
+    
+    # After an odd number of passes the result lives in the scratch buffer
+    if src is not arr:
+        arr[:] = src
+    return arr
+
+def gallop_merge(src, dst, lo, mid, hi):
+    """
+    Merge the sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi].
+    
+    Args:
+        src: List holding the two adjacent sorted runs
+        dst: List of the same length that receives the merged run
+        lo, mid, hi: Bounds of the left run [lo, mid) and right run [mid, hi)
+    """
+    # Runs that are already in order are copied straight across
+    if mid >= hi or not src[mid] < src[mid - 1]:
+        for t in range(lo, hi):
+            dst[t] = src[t]
+        return
+    
+    i, j, k = lo, mid, lo
+    left_wins = right_wins = 0
+    while i < mid and j < hi:
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            j += 1
+            k += 1
+            right_wins += 1
+            left_wins = 0
+            if right_wins >= MIN_GALLOP:
+                # Take every right item strictly smaller than src[i] (stability)
+                end = bisect_left(src, src[i], j, hi)
+                for t in range(j, end):
+                    dst[k] = src[t]
+                    k += 1
+                j = end
+                right_wins = 0
+        else:
+            dst[k] = src[i]
+            i += 1
+            k += 1
+            left_wins += 1
+            right_wins = 0
+            if left_wins >= MIN_GALLOP and i < mid:
+                # Take every left item not greater than src[j]
+                end = bisect_right(src, src[j], i, mid)
+                for t in range(i, end):
+                    dst[k] = src[t]
+                    k += 1
+                i = end
+                left_wins = 0
+    
+    # Copy whatever is left of the unfinished run
+    start, stop = (i, mid) if i < mid else (j, hi)
+    for t in range(start, stop):
+        dst[k] = src[t]
+        k += 1
+
+def _insertion_sort_range(arr, lo, hi):
+    """Insertion sort arr[lo:hi] in place."""
+    for i in range(lo + 1, hi):
+        key = arr[i]
+        j = i - 1
+        while j >= lo and key < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+def parallel_merge_sort(arr, workers=None, threshold=PARALLEL_THRESHOLD):
+    """
+    Sort a numeric array in place using several processes.
+    
+    The items are packed into a shared memory block of int64 or float64
+    values, so the worker processes sort their chunk directly in that block
+    and nothing is pickled except the chunk bounds. The sorted chunks are
+    then combined with a k-way heap merge.
+    
+    Inputs shorter than threshold, lists that are not all ints (fitting in
+    64 bits) or all floats, and single-worker setups fall back to
+    merge_sort_bottom_up.
+    
+    Args:
+        arr: List of ints or floats to sort
+        workers: Number of worker processes (defaults to the CPU count)
+        threshold: Minimum length before going parallel
+        
+    Returns:
+        The same list, sorted
+    """
+    n = len(arr)
+    workers = workers or os.cpu_count() or 1
+    typecode = numeric_typecode(arr) if n >= threshold and workers > 1 else None
+    if typecode is None:
+        return merge_sort_bottom_up(arr)
+    
+    data = array(typecode, arr)
+    shm = shared_memory.SharedMemory(create=True, size=n * data.itemsize)
+    try:
+        view = shm.buf.cast(typecode)[:n]
+        view[:] = data
+        del data
+        
+        step = -(-n // workers)
+        bounds = [(lo, min(lo + step, n)) for lo in range(0, n, step)]
+        with ProcessPoolExecutor(max_workers=len(bounds)) as pool:
+            tasks = [(shm.name, typecode, n, lo, hi) for lo, hi in bounds]
+            list(pool.map(_sort_shared_chunk, tasks))
+        
+        arr[:] = heapq.merge(*(view[lo:hi] for lo, hi in bounds))
+        view.release()
+    finally:
+        shm.close()
+        shm.unlink()
+    return arr
+
+def numeric_typecode(arr):
+    """
+    Return the array typecode that can hold every item of arr.
+    
+    Returns:
+        'q' if every item is an int that fits in 64 bits, 'd' if every item
+        is a float, None otherwise
+    """
+    if all(type(x) is float for x in arr):
+        return 'd'
+    if all(type(x) is int for x in arr):
+        if -2 ** 63 <= min(arr) and max(arr) < 2 ** 63:
+            return 'q'
+    return None
+
+def _sort_shared_chunk(task):
+    """Worker: sort items [lo, hi) of the shared memory block in place."""
+    name, typecode, n, lo, hi = task
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = shm.buf.cast(typecode)[:n]
+        view[lo:hi] = array(typecode, merge_sort_bottom_up(view[lo:hi].tolist()))
+        view.release()
+    finally:
+        shm.close()
+
 # Test cases
 if __name__ == "__main__":
     # Test case 1: Random array
@@ -74,4 +277,15 @@ if __name__ == "__main__":
     # Test case 3: Reverse sorted array
     arr3 = [5, 4, 3, 2, 1]
     print(f"Original array: {arr3}")
-    print(f"Sorted array: {merge_sort(arr3)}")
\ No newline at end of file
+    print(f"Sorted array: {merge_sort(arr3)}")
+    
+    # Test case 4: Bottom-up version on an array with duplicates
+    arr4 = [5, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5]
+    print(f"Original array: {arr4}")
+    print(f"Sorted array (bottom-up): {merge_sort(arr4, bottom_up=True)}")
+    
+    # Test case 5: Parallel version on a large random array
+    import random
+    arr5 = [random.randint(-10**6, 10**6) for _ in range(PARALLEL_THRESHOLD * 2)]
+    expected = sorted(arr5)
+    print(f"Parallel sort of {len(arr5)} items correct: {parallel_merge_sort(arr5) == expected}")
\ No newline at end of file